@@ -10,24 +10,38 @@ from volkswagencarnet.vw_connection import Connection
 from .constants import resource_path
 
 
-@pytest_asyncio.fixture
+DUMMY_COOKIES = os.path.join(resource_path, "dummy_cookies.pickle")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def session():
-    """Client session that can be used in tests."""
+    """Client session shared by all tests."""
     jar = CookieJar()
-    jar.load(os.path.join(resource_path, "dummy_cookies.pickle"))
+    jar.load(DUMMY_COOKIES)
     sess = ClientSession(headers={"Connection": "keep-alive"}, cookie_jar=jar)
     yield sess
     await sess.close()
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def clean_session():
+    """Client session without any cookies, shared by all tests."""
+    sess = ClientSession(headers={"Connection": "keep-alive"})
+    yield sess
+    await sess.close()
+
+
 @pytest.fixture
 def connection(session):
-    """Real connection for integration tests."""
+    """Real connection for integration tests.
+
+    Set VW_FULLDEBUG=1 to log full request and response details.
+    """
     return Connection(
         session=session,
         username="",
         password="",
         country="DE",
         interval=999,
-        fulldebug=True,
+        fulldebug=os.environ.get("VW_FULLDEBUG") == "1",
     )
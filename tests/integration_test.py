@@ -6,7 +6,6 @@ Credentials have to be specified in credentials.py.
 
 import logging
 
-from aiohttp import ClientSession
 import pytest
 from volkswagencarnet import vw_connection
 
@@ -20,13 +19,12 @@ except ImportError:
     username is None or password is None,
     reason="Username or password is not set. Check credentials.py.sample",
 )
-@pytest.mark.asyncio
-async def test_successful_login() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_successful_login(clean_session) -> None:
     """Test that login succeeds."""
-    async with ClientSession() as session:
-        connection = vw_connection.Connection(session, username, password)
-        await connection.doLogin()
-        assert connection.logged_in is True
+    connection = vw_connection.Connection(clean_session, username, password)
+    await connection.doLogin()
+    assert connection.logged_in is True
 
 
 @pytest.mark.skipif(
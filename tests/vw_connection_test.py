@@ -1,8 +1,8 @@
 """Tests for main connection class."""
 
+import asyncio
 import sys
-from unittest import IsolatedAsyncioTestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import aiohttp
 from aiohttp import client_exceptions
@@ -10,33 +10,7 @@ import pytest
 from volkswagencarnet import vw_connection
 from volkswagencarnet.vw_connection import Connection
 
-
-class TwoVehiclesConnection(Connection):
-    """Connection that return two vehicles."""
-
-    ALLOW_RATE_LIMIT_DELAY = False
-
-    # noinspection PyUnusedLocal
-    # noinspection PyMissingConstructor
-    def __init__(self, sess, username="", password="", **kwargs):
-        """Init."""
-        super().__init__(session=sess, username=username, password=password)
-        self._jarCookie = MagicMock()
-
-    async def doLogin(self, tries=1):
-        """No-op update."""
-        return True
-
-    async def update(self):
-        """No-op update."""
-        return True
-
-    @property
-    def vehicles(self):
-        """Return the vehicles."""
-        vehicle1 = vw_connection.Vehicle(None, "vin1")
-        vehicle2 = vw_connection.Vehicle(None, "vin2")
-        return [vehicle1, vehicle2]
+from .fixtures.connection import DUMMY_COOKIES
 
 
 @pytest.mark.skipif(
@@ -45,19 +19,24 @@ class TwoVehiclesConnection(Connection):
 def test_clear_cookies(connection) -> None:
     """Check that we can clear old cookies."""
     assert len(connection._session._cookie_jar._cookies) > 0
-    connection._clear_cookies()
-    assert len(connection._session._cookie_jar._cookies) == 0
+    try:
+        connection._clear_cookies()
+        assert len(connection._session._cookie_jar._cookies) == 0
+    finally:
+        # The session is shared between tests, so restore the dummy cookies
+        connection._session._cookie_jar.load(DUMMY_COOKIES)
 
 
-class SendCommandsTest(IsolatedAsyncioTestCase):
+class SendCommandsTest:
     """Test command sending."""
 
+    @pytest.mark.asyncio
     async def test_set_schedule(self):
         """Test set schedule."""
         pass
 
 
-class RateLimitTest(IsolatedAsyncioTestCase):
+class RateLimitTest:
     """Test that rate limiting towards VW works."""
 
     invocations = 0
@@ -75,24 +54,44 @@ class RateLimitTest(IsolatedAsyncioTestCase):
         condition=sys.version_info < (3, 11),
         reason="Test incompatible with Python < 3.11",
     )
-    @patch(
-        "volkswagencarnet.vw_connection.Connection",
-        spec_set=vw_connection.Connection,
-        new=TwoVehiclesConnection,
-    )
+    @patch("volkswagencarnet.vw_connection.asyncio.sleep", new_callable=AsyncMock)
     @patch("volkswagencarnet.vw_connection.MAX_RETRIES_ON_RATE_LIMIT", 1)
-    async def test_rate_limit(self):
+    async def test_rate_limit(self, sleep):
         """Test rate limiting functionality."""
-
-        from unittest.mock import AsyncMock
-
-        sess = AsyncMock()
-
-        # noinspection PyArgumentList
-        conn = vw_connection.Connection(sess, "", "")
+        conn = Connection(AsyncMock(), "", "")
 
         self.invocations = 0
         with patch.object(conn, "_request", self.rateLimitedFunction):
             res = await conn.get("foo")
             assert res == {"status_code": 429}
         assert self.invocations == vw_connection.MAX_RETRIES_ON_RATE_LIMIT + 1
+        assert sleep.await_count == vw_connection.MAX_RETRIES_ON_RATE_LIMIT
+
+
+@pytest.mark.asyncio
+async def test_get_vehicle_data_shares_request() -> None:
+    """Test that concurrent vehicle data requests are sent only once."""
+    conn = Connection(AsyncMock(), "", "")
+
+    async def get(url, vin=""):
+        await asyncio.sleep(0)
+        return {"data": [{"vin": "vin1"}, {"vin": "vin2"}]}
+
+    with (
+        patch.object(
+            Connection,
+            "validate_tokens",
+            new_callable=PropertyMock,
+            side_effect=lambda: asyncio.sleep(0, True),
+        ),
+        patch.object(conn, "get", AsyncMock(side_effect=get)) as get_mock,
+    ):
+        res = await asyncio.gather(
+            conn.getVehicleData("vin1"), conn.getVehicleData("vin2")
+        )
+        assert res == [{"vehicle": {"vin": "vin1"}}, {"vehicle": {"vin": "vin2"}}]
+        assert get_mock.await_count == 1
+
+        # Later calls fetch fresh data
+        await conn.getVehicleData("vin1")
+        assert get_mock.await_count == 2
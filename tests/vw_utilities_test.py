@@ -3,10 +3,15 @@
 from datetime import datetime, timedelta, timezone
 from json import JSONDecodeError
 from unittest import TestCase
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from volkswagencarnet.vw_utilities import (
+    AdaptiveTokenBucket,
+    PathCachingDict,
     camel2slug,
+    find_first_path,
+    find_path,
     is_valid_path,
     json_loads,
     make_url,
@@ -68,15 +73,78 @@ class UtilitiesTest(TestCase):
         assert is_valid_path({"a": [{"b": True}, {"c": True}]}, "a.0.b")
         assert not is_valid_path({"a": [{"b": True}, {"c": True}]}, "a.2")
 
+    def test_find_path_with_tuple(self):
+        """Test that pre-split paths are accepted."""
+        src = {"a": [{"b": 1}, {"c": 2}]}
+        assert find_path(src, ("a", "1", "c")) == 2
+        assert find_path(PathCachingDict(src), ("a", "0", "b")) == 1
+        assert not is_valid_path(src, ("a", "0", "c"))
+
+    def test_find_path_default(self):
+        """Test that a default is returned for missing paths without logging."""
+        src = {"a": {"b": None}}
+        with self.assertNoLogs("volkswagencarnet.vw_utilities"):
+            assert find_path(src, "a.c", default=0) == 0
+            assert find_path(src, "a.b", default=0) is None
+        with self.assertLogs("volkswagencarnet.vw_utilities", "ERROR"):
+            assert find_path(src, "a.c") is None
+
+    def test_find_first_path(self):
+        """Test that later paths are only looked up when earlier ones are missing."""
+        src = PathCachingDict({"a": {"b": 1}, "c": None})
+        assert find_first_path(src, "a.b", "c") == 1
+        assert "c" not in src.cache
+        assert find_first_path(src, "a.x", "c", default=0) is None
+        assert find_first_path(src, "a.x", "d") is None
+        assert find_first_path(src, "a.x", "d", default=-1) == -1
+
+    def test_path_caching_dict(self):
+        """Test that cached lookups are invalidated when the dictionary changes."""
+        src = PathCachingDict({"a": {"b": 1}})
+        assert find_path(src, "a.b") == 1
+        assert not is_valid_path(src, "c.d")
+        # Parent paths are cached too, so lookups sharing a prefix reuse them
+        assert set(src.cache) == {"a", "a.b", "c", "c.d"}
+        assert find_path(src, ("a", "b")) == 1
+        assert ("a",) in src.cache
+
+        src["c"] = {"d": 2}
+        assert find_path(src, "c.d") == 2
+        src.update({"a": {"b": 3}})
+        assert find_path(src, "a.b") == 3
+        src |= {"a": {"b": 4}}
+        assert find_path(src, "a.b") == 4
+        del src["a"]
+        assert not is_valid_path(src, "a.b")
+        src.setdefault("a", {"b": 5})
+        assert find_path(src, "a.b") == 5
+        src.pop("a")
+        assert not is_valid_path(src, "a")
+        src.clear()
+        assert not is_valid_path(src, "c")
+
     def test_obj_parser(self):
         """Test that the object parser works."""
         data = {
             "int": [0, AttributeError],
             "dict": [{"foo": "bar"}, {"foo": "bar"}],
+            "dict without time": [
+                {"foo": 1, "bar": "2001-01-01", "baz": "not a 2001-01-01T23:59:59Z"},
+                {"foo": 1, "bar": "2001-01-01", "baz": "not a 2001-01-01T23:59:59Z"},
+            ],
             "dict with time": [
                 {"foo": "2001-01-01T23:59:59Z"},
                 {"foo": datetime(2001, 1, 1, 23, 59, 59, tzinfo=timezone.utc)},
             ],
+            "dict with fractional time": [
+                {"foo": "2001-01-01T23:59:59.123Z", "bar": "2001-01-01T23:59:59"},
+                {
+                    "foo": datetime(
+                        2001, 1, 1, 23, 59, 59, 123000, tzinfo=timezone.utc
+                    ),
+                    "bar": "2001-01-01T23:59:59",
+                },
+            ],
             "dict with timezone": [
                 {"foo": "2001-01-01T23:59:59+0200"},
                 {
@@ -114,3 +182,42 @@ class UtilitiesTest(TestCase):
         """Test placeholder replacements."""
         assert make_url("foo/{bar}/baz{baz}", bar=2, baz="") == "foo/2/baz"
         assert make_url("foo/{baz}/$bar", bar=2, baz="asd") == "foo/asd/2"
+
+
+@pytest.mark.asyncio
+async def test_adaptive_token_bucket() -> None:
+    """Test that the token bucket waits for tokens and adapts its rate."""
+    clock = [0.0]
+
+    async def sleep(delay):
+        clock[0] += delay
+
+    with (
+        patch("volkswagencarnet.vw_utilities.monotonic", lambda: clock[0]),
+        patch(
+            "volkswagencarnet.vw_utilities.asyncio.sleep",
+            new_callable=AsyncMock,
+            side_effect=sleep,
+        ) as sleep_mock,
+    ):
+        bucket = AdaptiveTokenBucket(rate=1.0, capacity=2, min_rate=0.25, max_rate=2.0)
+        await bucket.acquire()
+        await bucket.acquire()
+        sleep_mock.assert_not_awaited()
+
+        await bucket.acquire()
+        assert clock[0] == pytest.approx(1.0)
+
+        bucket.decrease_rate()
+        bucket.decrease_rate()
+        bucket.decrease_rate()
+        assert bucket.rate == 0.25
+        await bucket.acquire()
+        assert clock[0] == pytest.approx(5.0)
+
+        # The rate recovers after throttling and may exceed the initial rate
+        bucket.increase_rate()
+        assert bucket.rate == pytest.approx(0.3)
+        for _ in range(100):
+            bucket.increase_rate()
+        assert bucket.rate == 2.0
@@ -2,20 +2,45 @@
 
 from datetime import UTC, datetime, timedelta
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aiohttp import ClientSession
 from freezegun import freeze_time
 import pytest
 from volkswagencarnet.vw_const import Services
+from volkswagencarnet.vw_dashboard import DoorLock
 from volkswagencarnet.vw_vehicle import (
+    ENGINE_TYPE_CNG,
     ENGINE_TYPE_DIESEL,
     ENGINE_TYPE_ELECTRIC,
     ENGINE_TYPE_GASOLINE,
+    REQUEST_POLL_MAX_DELAY,
+    REQUEST_POLL_TIMEOUT,
+    RequestState,
     Vehicle,
 )
 
 
+def mock_updating_vehicle(name: str, min_update_interval: float = 0) -> MagicMock:
+    """Return a mocked discovered Vehicle that runs the real update method."""
+    vehicle = MagicMock(spec=Vehicle, name=name)
+    vehicle.update = lambda **kwargs: Vehicle.update(vehicle, **kwargs)
+    vehicle._discovered = True
+    vehicle.deactivated = False
+    vehicle._min_update_interval = min_update_interval
+    vehicle._last_update_monotonic = None
+    vehicle._states = {}
+    for method in (
+        vehicle.get_selectivestatus,
+        vehicle.get_vehicle,
+        vehicle.get_parkingposition,
+        vehicle.get_trip_last,
+        vehicle.get_service_status,
+    ):
+        method.return_value = {}
+    return vehicle
+
+
 class VehicleTest(IsolatedAsyncioTestCase):
     """Test Vehicle methods."""
 
@@ -34,13 +59,11 @@ class VehicleTest(IsolatedAsyncioTestCase):
             assert not vehicle._discovered
             assert not vehicle._states
             expected_requests = {
-                "departuretimer": {"status": "", "timestamp": target_date},
-                "batterycharge": {"status": "", "timestamp": target_date},
-                "climatisation": {"status": "", "timestamp": target_date},
-                "refresh": {"status": "", "timestamp": target_date},
-                "lock": {"status": "", "timestamp": target_date},
-                "latest": "",
-                "state": "",
+                "departuretimer": RequestState(timestamp=target_date),
+                "batterycharge": RequestState(timestamp=target_date),
+                "climatisation": RequestState(timestamp=target_date),
+                "refresh": RequestState(timestamp=target_date),
+                "lock": RequestState(timestamp=target_date),
             }
 
             expected_services = {
@@ -62,6 +85,8 @@ class VehicleTest(IsolatedAsyncioTestCase):
             }
 
             assert vehicle._requests == expected_requests
+            assert vehicle._requests_latest == ""
+            assert vehicle._requests_state == ""
             assert vehicle._services == expected_services
 
     def test_str(self):
@@ -69,8 +94,51 @@ class VehicleTest(IsolatedAsyncioTestCase):
         vehicle = Vehicle(None, "XYZ1234567890")
         assert str(vehicle) == "XYZ1234567890"
 
-    def test_discover(self):
+    async def test_discover(self):
         """Test the discovery process."""
+        conn = MagicMock()
+        conn.getOperationList = AsyncMock(
+            return_value={
+                "parameters": {"foo": "bar"},
+                "capabilities": {
+                    Services.ACCESS: {
+                        "id": Services.ACCESS,
+                        "isEnabled": True,
+                        "expirationDate": "2030-01-01T00:00:00Z",
+                        "operations": {"lock": {"id": "lock"}, "unlock": {"id": "unlock"}},
+                        "parameters": [],
+                    },
+                    Services.CHARGING: {
+                        "id": Services.CHARGING,
+                        "isEnabled": False,
+                        "status": "disabled",
+                    },
+                    Services.CLIMATISATION: {
+                        "id": Services.CLIMATISATION,
+                        "isEnabled": True,
+                        "parameters": [
+                            {"key": "supportsStartWindowHeating", "value": "true"}
+                        ],
+                    },
+                    "unknownService": {"id": "unknownService", "isEnabled": True},
+                },
+            }
+        )
+        vehicle = Vehicle(conn, "dummy34")
+
+        await vehicle.discover()
+
+        assert vehicle._discovered
+        assert vehicle._services[Services.PARAMETERS] == {"foo": "bar"}
+        assert vehicle._services[Services.ACCESS] == {
+            "active": True,
+            "operations": ["lock", "unlock"],
+            "parameters": [],
+            "expiration": "2030-01-01T00:00:00Z",
+        }
+        assert vehicle._services[Services.CHARGING] == {"active": False}
+        assert "unknownService" not in vehicle._services
+        assert vehicle.is_window_heater_supported
 
     @pytest.mark.asyncio
     async def test_update_deactivated(self):
@@ -79,6 +147,9 @@ class VehicleTest(IsolatedAsyncioTestCase):
         vehicle.update = lambda: Vehicle.update(vehicle)
         vehicle._discovered = True
         vehicle._deactivated = True
+        vehicle._min_update_interval = 0
+        vehicle._last_update_monotonic = None
+        vehicle._states = {}
 
         await vehicle.update()
 
@@ -90,11 +161,11 @@ class VehicleTest(IsolatedAsyncioTestCase):
 
     async def test_update(self):
         """Test that update calls the wanted methods and nothing else."""
-        vehicle = MagicMock(spec=Vehicle, name="MockUpdateVehicle")
-        vehicle.update = lambda: Vehicle.update(vehicle)
-
+        vehicle = mock_updating_vehicle("MockUpdateVehicle")
         vehicle._discovered = False
-        vehicle.deactivated = False
+        vehicle.get_selectivestatus.return_value = {Services.ACCESS: {"foo": 1}}
+        vehicle.get_vehicle.return_value = {"vehicle": {"vin": "vin1"}}
+        vehicle.get_service_status.return_value = {Services.SERVICE_STATUS: {}}
         await vehicle.update()
 
         vehicle.discover.assert_called_once()
@@ -109,6 +180,111 @@ class VehicleTest(IsolatedAsyncioTestCase):
             len(vehicle.method_calls) == 6
         ), f"Wrong number of methods called. Expected 6, got {len(vehicle.method_calls)}"
 
+        # Results of all requests are merged into the state
+        assert vehicle._states == {
+            Services.ACCESS: {"foo": 1},
+            "vehicle": {"vin": "vin1"},
+            Services.SERVICE_STATUS: {},
+        }
+
+        # Once discovered, vehicle data is fetched together with the status
+        vehicle.reset_mock()
+        vehicle._discovered = True
+        await vehicle.update()
+
+        vehicle.discover.assert_not_called()
+        vehicle.get_vehicle.assert_called_once()
+        assert len(vehicle.method_calls) == 5
+
+    async def test_update_failure(self):
+        """Test that a failing fetch raises its own error after merging the rest."""
+        vehicle = mock_updating_vehicle("MockFailingVehicle")
+        vehicle.get_selectivestatus.return_value = {Services.ACCESS: {"foo": 1}}
+        vehicle.get_parkingposition.side_effect = ValueError("parking failed")
+
+        with pytest.raises(ValueError, match="parking failed"):
+            await vehicle.update()
+
+        assert vehicle._states == {Services.ACCESS: {"foo": 1}}
+        vehicle.get_service_status.assert_not_called()
+        assert vehicle._last_update_monotonic is None
+
+    async def test_update_skipped_when_fresh(self):
+        """Test that update does nothing right after a previous update."""
+        vehicle = mock_updating_vehicle("MockFreshVehicle", min_update_interval=30)
+
+        await vehicle.update()
+        assert len(vehicle.method_calls) == 5
+
+        vehicle.reset_mock()
+        await vehicle.update()
+        assert len(vehicle.method_calls) == 0
+
+        await vehicle.update(force=True)
+        assert len(vehicle.method_calls) == 5
+
+    async def test_update_after_action(self):
+        """Test that actions refresh the vehicle even if its data is fresh."""
+        vehicle = mock_updating_vehicle("MockActionVehicle", min_update_interval=30)
+        await vehicle.update()
+        vehicle.reset_mock()
+
+        lock = DoorLock()
+        lock.vehicle = vehicle
+        assert await lock.lock()
+
+        vehicle.set_lock.assert_awaited_once()
+        vehicle.get_selectivestatus.assert_called_once()
+
+    async def test_update_timestamp(self):
+        """Test that status timestamps only change when the vehicle is updated."""
+        vehicle = mock_updating_vehicle("MockTimestampVehicle")
+
+        with freeze_time("2022-02-14 03:04:05"):
+            await vehicle.update()
+        expected = datetime(2022, 2, 14, 3, 4, 5, tzinfo=UTC)
+        assert vehicle._last_update_time == expected
+        assert Vehicle.last_data_refresh_last_updated.fget(vehicle) == expected
+        assert Vehicle.api_token_status_last_updated.fget(vehicle) == expected
+
+    @patch("volkswagencarnet.vw_vehicle.asyncio.sleep", new_callable=AsyncMock)
+    async def test_wait_for_request(self, sleep):
+        """Test that request status is polled with increasing delays."""
+        conn = MagicMock()
+        conn.get_request_status = AsyncMock(
+            side_effect=["In Progress"] * 5 + ["successful"]
+        )
+        vehicle = Vehicle(conn, "dummy34")
+
+        assert await vehicle.wait_for_request("req1") == "successful"
+        assert conn.get_request_status.await_count == 6
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert len(delays) == 5
+        assert delays[0] < delays[-1] <= 1.5 * REQUEST_POLL_MAX_DELAY
+
+    async def test_wait_for_request_timeout(self):
+        """Test that polling gives up once the time budget is used up."""
+        clock = [0.0]
+
+        async def sleep(delay):
+            clock[0] += delay
+
+        conn = MagicMock()
+        conn.get_request_status = AsyncMock(return_value="In Progress")
+        vehicle = Vehicle(conn, "dummy34")
+        with (
+            patch("volkswagencarnet.vw_vehicle.monotonic", lambda: clock[0]),
+            patch("volkswagencarnet.vw_vehicle.asyncio.sleep", side_effect=sleep),
+            patch("volkswagencarnet.vw_vehicle.random", return_value=0.0),
+        ):
+            assert await vehicle.wait_for_request("req2") == "Timeout"
+        # The former retry_count can no longer be passed positionally
+        with pytest.raises(TypeError):
+            await vehicle.wait_for_request("req3", 18)
+        # Shortest jittered delays still wait for the whole budget
+        assert clock[0] == pytest.approx(REQUEST_POLL_TIMEOUT)
+        assert conn.get_request_status.await_count > 18
+
 
 class VehiclePropertyTest(IsolatedAsyncioTestCase):
     """Tests for properties in Vehicle."""
@@ -126,6 +302,29 @@ class VehiclePropertyTest(IsolatedAsyncioTestCase):
             expected_res = '{\n    "a string": "yay",\n    "some date": "2022-02-22T02:22:20+02:00"\n}'
             assert res == expected_res
 
+    async def test_cached_by_state(self):
+        """Test that memoized properties follow state updates."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert vehicle.nickname is None
+        assert not vehicle.is_nickname_supported
+
+        vehicle._states.update({"vehicle": {"nickname": "Herbie"}})
+        assert vehicle.nickname == "Herbie"
+        assert vehicle.is_nickname_supported
+
+        vehicle._states["vehicle"] = {"model": "Beetle"}
+        assert vehicle.nickname is None
+        assert vehicle.model == "Beetle"
+
+        assert not vehicle.is_charging_supported
+        vehicle._states[Services.CHARGING] = {
+            "chargingStatus": {
+                "value": {"chargingState": "charging", "carCapturedTimestamp": "now"}
+            }
+        }
+        assert vehicle.charging
+        assert vehicle.charger_type_last_updated == "now"
+
     async def test_lock_not_supported(self):
         """Test that remote locking throws exception if not supported."""
         vehicle = Vehicle(conn=None, url="dummy34")
@@ -151,30 +350,304 @@ class VehiclePropertyTest(IsolatedAsyncioTestCase):
         assert str(exc_info.value) == expected_message
 
         # simulate request in progress
-        vehicle._requests["lock"] = {
-            "id": "Foo",
-            "timestamp": datetime.now(UTC) - timedelta(seconds=20),
-        }
+        vehicle._requests["lock"] = RequestState(
+            id="Foo", timestamp=datetime.now(UTC) - timedelta(seconds=20)
+        )
         assert await vehicle.set_lock("lock", "") is False
 
     async def test_in_progress(self):
         """Test that _in_progress works as expected."""
         vehicle = Vehicle(conn=None, url="dummy34")
-        vehicle._requests["timed_out"] = {
-            "id": "1",
-            "timestamp": datetime.now(UTC) - timedelta(minutes=20),
-        }
-        vehicle._requests["in_progress"] = {
-            "id": 2,
-            "timestamp": datetime.now(UTC) - timedelta(seconds=20),
-        }
-        vehicle._requests["unknown"] = {"id": "Foo"}
+        vehicle._requests["timed_out"] = RequestState(
+            id="1", timestamp=datetime.now(UTC) - timedelta(minutes=20)
+        )
+        vehicle._requests["in_progress"] = RequestState(
+            id=2, timestamp=datetime.now(UTC) - timedelta(seconds=20)
+        )
+        vehicle._requests["unknown"] = RequestState(id="Foo")
         assert not vehicle._in_progress("timed_out")
         assert vehicle._in_progress("in_progress")
         assert not vehicle._in_progress("not-defined")
         assert vehicle._in_progress("unknown", 2)
         assert not vehicle._in_progress("unknown", 4)
 
+    async def test_last_connected(self):
+        """Test that the odometer timestamp is returned without microseconds."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        vehicle._states[Services.MEASUREMENTS] = {
+            "odometerStatus": {
+                "value": {
+                    "odometer": 1234,
+                    "carCapturedTimestamp": datetime(
+                        2022, 2, 14, 3, 4, 5, 678000, tzinfo=UTC
+                    ),
+                }
+            }
+        }
+        expected = datetime(2022, 2, 14, 3, 4, 5, tzinfo=UTC)
+        assert vehicle.last_connected == expected
+        assert vehicle.last_connected_last_updated == expected
+
+    async def test_charging_timestamps(self):
+        """Test that properties of one status share its timestamp."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        vehicle._states[Services.CHARGING] = {
+            "plugStatus": {"value": {"carCapturedTimestamp": "plug"}},
+            "batteryStatus": {"value": {"carCapturedTimestamp": "battery"}},
+        }
+        assert vehicle.charging_cable_locked_last_updated == "plug"
+        assert vehicle.charging_cable_connected_last_updated == "plug"
+        assert vehicle.external_power_last_updated == "plug"
+        assert vehicle.battery_level_last_updated == "battery"
+        assert vehicle.battery_cruising_range_last_updated == "battery"
+
+    async def test_energy_flow(self):
+        """Test that energy flow properties handle missing data."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert not vehicle.energy_flow
+        assert vehicle.energy_flow_last_updated is None
+        assert not vehicle.is_energy_flow_supported
+        assert vehicle.position_last_updated == "Unknown"
+
+        # Intermediate values that are not dictionaries count as missing
+        vehicle._states["charger"] = {"status": None}
+        vehicle._states["parkingposition"] = None
+        assert not vehicle.energy_flow
+        assert vehicle.energy_flow_last_updated is None
+        assert not vehicle.is_energy_flow_supported
+        assert vehicle.position_last_updated == "Unknown"
+
+        vehicle._states["charger"] = {
+            "status": {
+                "chargingStatusData": {
+                    "energyFlow": {"content": "on", "timestamp": "now"}
+                }
+            }
+        }
+        assert vehicle.energy_flow
+        assert vehicle.energy_flow_last_updated == "now"
+        assert vehicle.is_energy_flow_supported
+
+    async def test_fuel_level(self):
+        """Test that the measurements fuel level takes precedence."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert vehicle.fuel_level == ""
+        assert vehicle.fuel_level_last_updated == ""
+
+        vehicle._states[Services.FUEL_STATUS] = {
+            "rangeStatus": {
+                "value": {
+                    "carType": ENGINE_TYPE_GASOLINE,
+                    "carCapturedTimestamp": "fuel status",
+                    "primaryEngine": {"currentFuelLevel_pct": 40},
+                }
+            }
+        }
+        assert vehicle.fuel_level == 40
+        assert vehicle.fuel_level_last_updated == "fuel status"
+
+        vehicle._states[Services.MEASUREMENTS] = {
+            "fuelLevelStatus": {
+                "value": {
+                    "carCapturedTimestamp": "measurements",
+                    "currentFuelLevel_pct": 41,
+                }
+            }
+        }
+        assert vehicle.fuel_level == 41
+        assert vehicle.fuel_level_last_updated == "measurements"
+
+    async def test_position(self):
+        """Test position of parked and moving vehicles."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert vehicle.position == {"lat": "?", "lng": "?"}
+
+        vehicle._states["parkingposition"] = {
+            "lat": 52.5,
+            "lon": "13.4",
+            "carCapturedTimestamp": "now",
+        }
+        assert vehicle.position == {"lat": 52.5, "lng": 13.4, "timestamp": "now"}
+
+        vehicle._states["isMoving"] = True
+        assert vehicle.position == {"lat": None, "lng": None, "timestamp": None}
+
+    async def test_windows_and_doors(self):
+        """Test window and door states looked up by name."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert not vehicle.is_window_closed_left_front_supported
+        assert not vehicle.is_hood_closed_supported
+
+        vehicle._states[Services.ACCESS] = {
+            "accessStatus": {
+                "value": {
+                    "windows": [
+                        {"name": "frontLeft", "status": ["closed"]},
+                        {"name": "frontRight", "status": ["open"]},
+                        {"name": "sunRoof", "status": ["unsupported"]},
+                        {"name": "rearLeft", "status": ["invalid"]},
+                    ],
+                    "doors": [
+                        {"name": "bonnet", "status": ["closed"]},
+                        {"name": "trunk", "status": ["locked", "closed"]},
+                    ],
+                }
+            }
+        }
+        assert vehicle.is_window_closed_left_front_supported
+        assert vehicle.window_closed_left_front
+        assert vehicle.window_closed_right_front is False
+        assert vehicle.window_closed_left_back is None
+        assert not vehicle.is_sunroof_closed_supported
+        assert not vehicle.is_window_closed_right_back_supported
+        assert vehicle.windows_closed is False
+        assert vehicle.is_windows_closed_supported
+
+        assert vehicle.is_hood_closed_supported
+        assert vehicle.hood_closed
+        assert vehicle.trunk_closed
+        assert vehicle.trunk_locked
+        assert not vehicle.is_door_closed_left_front_supported
+
+        # An unknown window state leaves the combined state unknown
+        vehicle._states[Services.ACCESS] = {
+            "accessStatus": {
+                "value": {
+                    "windows": [
+                        {"name": "frontLeft", "status": ["closed"]},
+                        {"name": "frontRight", "status": ["closed"]},
+                        {"name": "rearRight", "status": ["closed"]},
+                        {"name": "rearLeft", "status": ["invalid"]},
+                    ]
+                }
+            }
+        }
+        assert vehicle.windows_closed is None
+
+    async def test_departure_timers(self):
+        """Test that departure profile timers take precedence."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert vehicle.departure_timer(1) is None
+        assert vehicle.departure_timer1_last_updated is None
+
+        vehicle._states[Services.DEPARTURE_PROFILES] = {
+            "departureProfilesStatus": {
+                "value": {
+                    "carCapturedTimestamp": "profiles",
+                    "timers": [{"id": 1, "enabled": True}],
+                }
+            }
+        }
+        vehicle._states[Services.DEPARTURE_TIMERS] = {
+            "departureTimersStatus": {
+                "value": {
+                    "carCapturedTimestamp": "timers",
+                    "timers": [{"id": 1, "enabled": False}, {"id": 2}],
+                }
+            }
+        }
+        assert vehicle.departure_timer1
+        assert not vehicle.departure_timer2
+        assert not vehicle.is_departure_timer3_supported
+        assert vehicle.departure_timer3_last_updated == "profiles"
+
+    async def test_trip_last(self):
+        """Test last trip values read from the trip entry."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert not vehicle.is_trip_last_average_speed_supported
+
+        vehicle._states[Services.TRIP_LAST] = {
+            "tripEndTimestamp": "now",
+            "averageSpeed_kmph": 42,
+            "averageFuelConsumption": 5,
+            "travelTime": "unknown",
+            "mileage_km": True,
+        }
+        assert vehicle.is_trip_last_average_speed_supported
+        assert vehicle.trip_last_average_speed == 42
+        assert vehicle.trip_last_average_fuel_consumption == 5.0
+        assert vehicle.trip_last_length_last_updated == "now"
+        assert not vehicle.is_trip_last_duration_supported
+        assert not vehicle.is_trip_last_length_supported
+        assert vehicle.trip_last_recuperation is None
+
+    async def test_request_results(self):
+        """Test that request states are reported per topic."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert not vehicle.request_in_progress
+
+        vehicle._requests["lock"].update("In progress", "Foo")
+        vehicle._requests["other"] = RequestState(status="Ignored", id="Bar")
+        assert vehicle.request_in_progress
+        assert (
+            vehicle.request_in_progress_last_updated
+            == vehicle._requests["lock"].timestamp
+        )
+        results = vehicle.request_results
+        assert results["lock"] == "In progress"
+        assert vehicle.lock_action_status == "In progress"
+        del vehicle._requests["refresh"]
+        assert vehicle.refresh_action_status == "None"
+        assert "other" not in results
+
+    async def test_api_status(self):
+        """Test that API statuses default to Unknown."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert vehicle.api_trips_status == "Unknown"
+        assert not vehicle.is_api_trips_status_supported
+
+        vehicle._states[Services.SERVICE_STATUS] = {"trips": "Up"}
+        vehicle._services[Services.TRIP_STATISTICS] = {"active": True}
+        assert vehicle.api_trips_status == "Up"
+        assert vehicle.api_token_status == "Unknown"
+        assert vehicle.is_api_trips_status_supported
+
+    async def test_window_heater(self):
+        """Test window heater states looked up by location."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert not vehicle.window_heater
+        assert not vehicle.is_window_heater_supported
+
+        vehicle._states[Services.CLIMATISATION] = {
+            "windowHeatingStatus": {
+                "value": {
+                    "carCapturedTimestamp": "now",
+                    "windowHeatingStatus": [
+                        {"windowLocation": "front", "windowHeatingState": "off"},
+                        {"windowLocation": "rear", "windowHeatingState": "on"},
+                    ],
+                }
+            }
+        }
+        assert vehicle.window_heater_front is False
+        assert vehicle.window_heater_back is True
+        assert vehicle.window_heater
+        assert vehicle.window_heater_last_updated == "now"
+        assert vehicle.window_heater_back_last_updated == "now"
+
+    @freeze_time("2022-02-14 03:04:05")
+    async def test_expired(self):
+        """Test that service expiration is compared in UTC."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        vehicle._discovered = True
+        vehicle._services[Services.ACCESS] = {
+            "active": True,
+            "expiration": datetime(2030, 1, 1, tzinfo=UTC),
+        }
+        vehicle._services[Services.CHARGING] = {
+            "active": True,
+            "expiration": "2022-02-14T03:00:00Z",
+        }
+        assert not await vehicle.expired(Services.ACCESS)
+        assert not await vehicle.expired(Services.CLIMATISATION)
+        assert vehicle._discovered
+
+        assert await vehicle.expired(Services.CHARGING)
+        assert vehicle._services[Services.CHARGING]["expiration"] == datetime(
+            2022, 2, 14, 3, tzinfo=UTC
+        )
+        assert not vehicle._discovered
+
     async def test_is_primary_engine_electric(self):
         """Test primary electric engine."""
         vehicle = Vehicle(conn=None, url="dummy34")
@@ -243,3 +716,55 @@ class VehiclePropertyTest(IsolatedAsyncioTestCase):
             }
         }
         assert not vehicle.has_combustion_engine
+
+    async def test_combustion_range(self):
+        """Test that ranges fall back to -1 when not reported."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert vehicle.fuel_range == -1
+        assert vehicle.gas_range == -1
+        assert vehicle.combustion_range == -1
+
+        vehicle._states[Services.MEASUREMENTS] = {
+            "rangeStatus": {"value": {"gasolineRange": 300, "totalRange_km": 500}}
+        }
+        assert vehicle.fuel_range == 300
+        assert vehicle.combustion_range == 300
+
+        vehicle._states[Services.MEASUREMENTS] = {
+            "rangeStatus": {"value": {"cngRange": 200, "totalRange_km": 500}}
+        }
+        assert vehicle.gas_range == 200
+        assert vehicle.combustion_range == 500
+
+    async def test_car_type(self):
+        """Test that the fuel status car type takes precedence."""
+        vehicle = Vehicle(conn=None, url="dummy34")
+        assert vehicle.car_type == "Unknown"
+        assert not vehicle.is_car_type_electric
+        assert not vehicle.is_car_type_gasoline
+
+        vehicle._states[Services.MEASUREMENTS] = {
+            "fuelLevelStatus": {"value": {"carType": ENGINE_TYPE_DIESEL}}
+        }
+        assert vehicle.car_type == "Diesel"
+        assert vehicle.is_car_type_diesel
+
+        vehicle._states[Services.FUEL_STATUS] = {
+            "rangeStatus": {"value": {"carType": ENGINE_TYPE_ELECTRIC}}
+        }
+        assert vehicle.car_type == "Electric"
+        assert vehicle.is_car_type_electric
+        assert not vehicle.is_car_type_diesel
+        assert not vehicle.is_primary_drive_gas()
+
+        vehicle._states[Services.FUEL_STATUS] = {
+            "rangeStatus": {"value": {"carType": ENGINE_TYPE_CNG}}
+        }
+        assert vehicle.is_primary_drive_gas()
+        assert not vehicle.is_car_type_gasoline
+
+        vehicle._states[Services.FUEL_STATUS] = {
+            "rangeStatus": {"value": {"carType": ENGINE_TYPE_GASOLINE}}
+        }
+        assert vehicle.is_car_type_gasoline
+        assert not vehicle.is_primary_drive_gas()
@@ -29,7 +29,7 @@ from .vw_const import (
     HEADERS_SESSION,
     USER_AGENT,
 )
-from .vw_utilities import json_loads
+from .vw_utilities import AdaptiveTokenBucket, json_loads
 from .vw_vehicle import Vehicle
 
 MAX_RETRIES_ON_RATE_LIMIT = 3
@@ -37,6 +37,7 @@ MAX_RETRIES_ON_RATE_LIMIT = 3
 _LOGGER = logging.getLogger(__name__)  # pylint: disable=unreachable
 
 TIMEOUT = timedelta(seconds=30)
+CLIENT_TIMEOUT = ClientTimeout(total=TIMEOUT.seconds)
 JWT_ALGORITHMS = ["RS256"]
 
 
@@ -77,6 +78,7 @@ class Connection:
         self._session_country = country.upper()
 
         self._vehicles = []
+        self._vehicles_request = None
 
         _LOGGER.debug("Using service %s", self._session_base)
 
@@ -84,6 +86,7 @@ class Connection:
         self._state = {}
 
         self._service_status = {}
+        self._rate_limiter = AdaptiveTokenBucket()
 
     def _clear_cookies(self):
         self._session._cookie_jar._cookies.clear()  # pylint: disable=protected-access
@@ -395,17 +398,19 @@ class Connection:
         _LOGGER.debug('HTTP %s "%s"', method, url)
         if kwargs.get("json", None):
             _LOGGER.debug("Request payload: %s", kwargs.get("json", None))
+        await self._rate_limiter.acquire()
         try:
             async with self._session.request(
                 method,
                 url,
                 headers=self._session_headers,
-                timeout=ClientTimeout(total=TIMEOUT.seconds),
+                timeout=CLIENT_TIMEOUT,
                 cookies=self._jarCookie,
                 raise_for_status=False,
                 **kwargs,
             ) as response:
                 response.raise_for_status()
+                self._rate_limiter.increase_rate()
 
                 # Update cookie jar
                 if self._jarCookie != "":
@@ -461,6 +466,8 @@ class Connection:
                     res = response
                 return res
         except client_exceptions.ClientResponseError as httperror:
+            if httperror.status == 429:
+                self._rate_limiter.decrease_rate()
             # Update service status
             await self.update_service_status(url, httperror.code)
             raise httperror from None
@@ -636,12 +643,24 @@ class Connection:
             _LOGGER.warning("Could not fetch selectivestatus, error: %s", error)
         return False
 
+    async def _get_vehicles_data(self):
+        """Get data of all vehicles of the account.
+
+        Concurrent callers, like the updates of several vehicles, share a
+        single request.
+        """
+        if self._vehicles_request is None or self._vehicles_request.done():
+            self._vehicles_request = asyncio.ensure_future(
+                self.get(f"{BASE_API}/vehicle/v2/vehicles", "")
+            )
+        return await asyncio.shield(self._vehicles_request)
+
     async def getVehicleData(self, vin):
         """Get car information like VIN, nickname, etc."""
         if not await self.validate_tokens:
             return False
         try:
-            response = await self.get(f"{BASE_API}/vehicle/v2/vehicles", "")
+            response = await self._get_vehicles_data()
 
             for vehicle in response.get("data"):
                 if vehicle.get("vin") == vin:
@@ -110,8 +110,8 @@ class VehicleStatusParameter:
 
     OUTSIDE_TEMPERATURE = "0x0301020001"
 
-    VALID_DOOR_STATUS = ["open", "closed"]
-    VALID_WINDOW_STATUS = ["open", "closed"]
+    VALID_DOOR_STATUS = frozenset({"open", "closed"})
+    VALID_WINDOW_STATUS = frozenset({"open", "closed"})
 
 
 class Services:
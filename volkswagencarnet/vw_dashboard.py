@@ -469,7 +469,7 @@ class DoorLock(Instrument):
         """Trigger Lock."""
         try:
             response = await self.vehicle.set_lock(VWDeviceClass.LOCK, self.spin)
-            await self.vehicle.update()
+            await self.vehicle.update(force=True)
             if self.callback is not None:
                 self.callback()
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -482,7 +482,7 @@ class DoorLock(Instrument):
         """Trigger Unlock."""
         try:
             response = await self.vehicle.set_lock("unlock", self.spin)
-            await self.vehicle.update()
+            await self.vehicle.update(force=True)
             if self.callback is not None:
                 self.callback()
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -564,7 +564,7 @@ class AuxiliaryDuration(Number):
     async def set_value(self, minutes: int):
         """Set value."""
         await self.vehicle.set_auxiliary_duration(minutes, self.spin)
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def min_value(self):
@@ -610,7 +610,7 @@ class BatteryTargetSOC(Number):
         await self.vehicle.set_charging_settings(
             setting="battery_target_charge_level", value=value
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def min_value(self):
@@ -656,7 +656,7 @@ class ClimatisationTargetTemperature(Number):
         await self.vehicle.set_climatisation_settings(
             setting="climatisation_target_temperature", value=value
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def min_value(self):
@@ -715,7 +715,7 @@ class ChargeMaxACAmpere(Select):
         await self.vehicle.set_charging_settings(
             setting="max_charge_amperage", value=ampere
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
 
 # Switches
@@ -738,7 +738,7 @@ class RequestUpdate(Switch):
     async def turn_on(self):
         """Turn on."""
         await self.vehicle.set_refresh()
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
         if self.callback is not None:
             self.callback()
 
@@ -775,12 +775,12 @@ class ElectricClimatisation(Switch):
     async def turn_on(self):
         """Turn on."""
         await self.vehicle.set_climatisation("start")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_climatisation("stop")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -817,12 +817,12 @@ class AuxiliaryClimatisation(Switch):
     async def turn_on(self):
         """Turn on."""
         await self.vehicle.set_auxiliary_climatisation("start", self.spin)
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_auxiliary_climatisation("stop", self.spin)
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -850,12 +850,12 @@ class Charging(Switch):
     async def turn_on(self):
         """Turn on."""
         await self.vehicle.set_charger("start")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_charger("stop")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -890,14 +890,14 @@ class ReducedACCharging(Switch):
         await self.vehicle.set_charging_settings(
             setting="reduced_ac_charging", value="reduced"
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_charging_settings(
             setting="reduced_ac_charging", value="maximum"
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -932,14 +932,14 @@ class AutoReleaseACConnector(Switch):
         await self.vehicle.set_charging_settings(
             setting="auto_release_ac_connector", value="permanent"
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_charging_settings(
             setting="auto_release_ac_connector", value="off"
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -967,12 +967,12 @@ class BatteryCareMode(Switch):
     async def turn_on(self):
         """Turn on."""
         await self.vehicle.set_charging_care_settings(value="activated")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_charging_care_settings(value="deactivated")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -1005,12 +1005,12 @@ class OptimisedBatteryUse(Switch):
     async def turn_on(self):
         """Turn on."""
         await self.vehicle.set_readiness_battery_support(value=True)
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_readiness_battery_support(value=False)
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -1051,14 +1051,14 @@ class DepartureTimer(Switch):
         await self.vehicle.set_departure_timer(
             timer_id=self._id, spin=self.spin, enable=True
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Disable timer."""
         await self.vehicle.set_departure_timer(
             timer_id=self._id, spin=self.spin, enable=False
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self):
@@ -1093,12 +1093,12 @@ class ACDepartureTimer(Switch):
     async def turn_on(self):
         """Enable timer."""
         await self.vehicle.set_ac_departure_timer(timer_id=self._id, enable=True)
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Disable timer."""
         await self.vehicle.set_ac_departure_timer(timer_id=self._id, enable=False)
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self):
@@ -1129,12 +1129,12 @@ class WindowHeater(Switch):
     async def turn_on(self):
         """Turn on."""
         await self.vehicle.set_window_heating("start")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_window_heating("stop")
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -1169,14 +1169,14 @@ class BatteryClimatisation(Switch):
         await self.vehicle.set_climatisation_settings(
             setting="climatisation_without_external_power", value=True
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_climatisation_settings(
             setting="climatisation_without_external_power", value=False
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -1211,14 +1211,14 @@ class AuxiliaryAC(Switch):
         await self.vehicle.set_climatisation_settings(
             setting="auxiliary_air_conditioning", value=True
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_climatisation_settings(
             setting="auxiliary_air_conditioning", value=False
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -1253,14 +1253,14 @@ class AutomaticWindowHeating(Switch):
         await self.vehicle.set_climatisation_settings(
             setting="automatic_window_heating", value=True
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_climatisation_settings(
             setting="automatic_window_heating", value=False
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -1295,14 +1295,14 @@ class ZoneFrontLeft(Switch):
         await self.vehicle.set_climatisation_settings(
             setting="zone_front_left", value=True
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_climatisation_settings(
             setting="zone_front_left", value=False
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
@@ -1337,14 +1337,14 @@ class ZoneFrontRight(Switch):
         await self.vehicle.set_climatisation_settings(
             setting="zone_front_right", value=True
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     async def turn_off(self):
         """Turn off."""
         await self.vehicle.set_climatisation_settings(
             setting="zone_front_right", value=False
         )
-        await self.vehicle.update()
+        await self.vehicle.update(force=True)
 
     @property
     def assumed_state(self) -> bool:
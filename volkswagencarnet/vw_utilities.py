@@ -1,11 +1,123 @@
 """Common utility functions."""
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 import json
 import logging
 import re
+from time import monotonic
 
 _LOGGER = logging.getLogger(__name__)
+_CAMEL_CASE_PATTERN = re.compile("((?<!_)[A-Z])")
+_CAMEL_CASE_TABLE = {ord(c): f"_{c.lower()}" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+_MISSING = object()
+
+
+class PathCachingDict(dict):
+    """Dictionary that memoizes path lookups until it is modified.
+
+    The cache may also hold other values derived from the content. Only
+    changes to the dictionary itself invalidate the cache, so nested values
+    have to be replaced instead of being modified in place.
+    """
+
+    __slots__ = ("cache",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize dictionary and an empty lookup cache."""
+        super().__init__(*args, **kwargs)
+        self.cache: dict[object, object] = {}
+
+    def __setitem__(self, key, value) -> None:
+        """Set item and invalidate cache."""
+        super().__setitem__(key, value)
+        self.cache.clear()
+
+    def __delitem__(self, key) -> None:
+        """Delete item and invalidate cache."""
+        super().__delitem__(key)
+        self.cache.clear()
+
+    def __ior__(self, other):
+        """Merge other mapping and invalidate cache."""
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        """Remove all items and invalidate cache."""
+        super().clear()
+        self.cache.clear()
+
+    def pop(self, *args):
+        """Remove item and invalidate cache."""
+        self.cache.clear()
+        return super().pop(*args)
+
+    def popitem(self):
+        """Remove last item and invalidate cache."""
+        self.cache.clear()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        """Set default value and invalidate cache."""
+        self.cache.clear()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        """Update dictionary and invalidate cache."""
+        super().update(*args, **kwargs)
+        self.cache.clear()
+
+
+class AdaptiveTokenBucket:
+    """Token bucket limiting request rate, adapting to server side throttling.
+
+    The refill rate grows additively while requests succeed, up to max_rate,
+    and is halved whenever the server throttles, down to min_rate.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        capacity: float = 20,
+        min_rate: float = 0.2,
+        max_rate: float = 5.0,
+        rate_step: float = 0.05,
+    ) -> None:
+        """Initialize a full bucket refilling at rate tokens per second."""
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate_step = rate_step
+        self.capacity = capacity
+        self.tokens = capacity
+        self._last_refill = monotonic()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        self._refill()
+        while self.tokens < 1:
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= 1
+
+    def increase_rate(self) -> None:
+        """Speed up refilling after a successful request."""
+        self.rate = min(self.max_rate, self.rate + self.rate_step)
+
+    def decrease_rate(self) -> None:
+        """Slow down refilling and drain the bucket after being throttled."""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0
 
 
 def json_loads(s) -> object:
@@ -16,14 +128,21 @@ def json_loads(s) -> object:
 def obj_parser(obj: dict) -> dict:
     """Parse datetime."""
     for key, val in obj.items():
+        # Only strings shaped like "YYYY-MM-DDTHH:MM:SS[.fff]<tz>" can be timestamps
+        if not isinstance(val, str) or len(val) < 20 or val[10] != "T":
+            continue
         try:
-            obj[key] = datetime.strptime(val, "%Y-%m-%dT%H:%M:%S%z")
-        except (TypeError, ValueError):
+            parsed = datetime.fromisoformat(val)
+        except ValueError:
             """The value was not a date."""  # pylint: disable=pointless-string-statement
+        else:
+            # Local times without offset are kept as strings
+            if parsed.tzinfo is not None:
+                obj[key] = parsed
     return obj
 
 
-def find_path_in_dict(src: dict | list, path: str | list) -> object:
+def find_path_in_dict(src: dict | list, path: str | list | tuple) -> object:
     """Return data at path in dictionary source.
 
     Simple navigation of a hierarchical dict structure using XPATH-like syntax.
@@ -51,35 +170,118 @@ def find_path_in_dict(src: dict | list, path: str | list) -> object:
     >>> find_path_in_dict(dict(a=dict(b=1)), 'a.c')
     Traceback (most recent call last):
     ...
-    KeyError: 'c'
+    KeyError: 'a.c'
+
+    >>> find_path_in_dict(dict(a=dict(b=1)), ('a', 'b'))
+    1
 
     """
+    value = _walk(src, path)
+    if value is _MISSING:
+        raise KeyError(path)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Return keys of a dotted path."""
+    return tuple(path.split("."))
+
+
+def _walk(src: dict | list, path: str | list | tuple) -> object:
+    """Return data at path in source, or _MISSING if it does not exist."""
     if not path:
         return src
-    if isinstance(path, str):
-        path = path.split(".")
+    for key in _split_path(path) if isinstance(path, str) else path:
+        src = _child(src, key)
+        if src is _MISSING:
+            break
+    return src
+
+
+def _child(src: dict | list, key: str) -> object:
+    """Return child of a dict or (by string index) list, or _MISSING."""
+    if isinstance(src, dict):
+        return src.get(key, _MISSING)
     if isinstance(src, list):
         try:
-            f = float(path[0])
-            if f.is_integer() and len(src) > 0:
-                return find_path_in_dict(src[int(f)], path[1:])
-            raise KeyError("Key not found")
-        except ValueError as valerr:
-            raise KeyError(f"{path[0]} should be an integer") from valerr
-        except IndexError as idxerr:
-            raise KeyError("Index out of range") from idxerr
-    return find_path_in_dict(src[path[0]], path[1:])
-
-
-def find_path(src: dict | list, path: str | list) -> object:
-    """Return data at path in source."""
+            f = float(key)
+        except ValueError:
+            return _MISSING
+        if f.is_integer() and -len(src) <= f < len(src):
+            return src[int(f)]
+    return _MISSING
+
+
+def _lookup(src: dict | list, path: str | list | tuple) -> object:
+    """Return data at path in source, or _MISSING if it does not exist.
+
+    Lookups in a PathCachingDict are served from its cache when possible.
+    On a miss, the parent path is looked up (and cached) first, so paths
+    sharing a prefix only walk the shared part once per state change.
+    """
+    if isinstance(src, PathCachingDict) and isinstance(path, (str, tuple)):
+        return _cached_lookup(src, path)
+    return _walk(src, path)
+
+
+def _cached_lookup(src: PathCachingDict, path: str | tuple) -> object:
+    """Return data at path in source, filling its cache for path and prefixes."""
+    cache = src.cache
     try:
-        return find_path_in_dict(src, path)
+        return cache[path]
     except KeyError:
-        _LOGGER.error(
-            "Dictionary path: %s is no longer present. Dictionary: %s", path, src
-        )
+        pass
+    if isinstance(path, str):
+        parent, _, key = path.rpartition(".")
+    else:
+        parent, key = path[:-1], path[-1] if path else None
+    if not parent:
+        value = _walk(src, path)
+    else:
+        value = _cached_lookup(src, parent)
+        if value is not _MISSING:
+            value = _child(value, key)
+    cache[path] = value
+    return value
+
+
+def find_path(
+    src: dict | list, path: str | list | tuple, default: object = _MISSING
+) -> object:
+    """Return data at path in source.
+
+    If path does not exist, default is returned when given, otherwise the
+    miss is logged and None is returned.
+    """
+    value = _lookup(src, path)
+    if value is _MISSING:
+        if default is not _MISSING:
+            return default
+        _LOGGER.error("Dictionary path: %s is no longer present", path)
+        _LOGGER.debug("Dictionary: %s", src)
         return None
+    return value
+
+
+def find_first_path(
+    src: dict | list, *paths: str | list | tuple, default: object = None
+) -> object:
+    """Return data at the first of paths present in source, or default.
+
+    Later paths are only looked up if the earlier ones are missing.
+
+    >>> find_first_path(dict(a=1, b=2), 'c', 'b', 'a')
+    2
+
+    >>> find_first_path(dict(a=1), 'b', 'c', default=0)
+    0
+    """
+    for path in paths:
+        value = _lookup(src, path)
+        if value is not _MISSING:
+            return value
+    return default
 
 
 def is_valid_path(src, path):
@@ -103,12 +305,7 @@ def is_valid_path(src, path):
     >>> is_valid_path({"a": [{"b": True}, {"c": True}]}, 'a.1.b')
     False
     """
-    try:
-        find_path_in_dict(src, path)
-    except KeyError:
-        return False
-    else:
-        return True
+    return _lookup(src, path) is not _MISSING
 
 
 def camel2slug(s: str) -> str:
@@ -119,7 +316,9 @@ def camel2slug(s: str) -> str:
 
     Should not produce "__" in case input contains something like "Foo_Bar"
     """
-    return re.sub("((?<!_)[A-Z])", "_\\1", s).lower().strip("_ \n\t\r")
+    if s.isascii() and "_" not in s:
+        return s.translate(_CAMEL_CASE_TABLE).strip("_ \n\t\r")
+    return _CAMEL_CASE_PATTERN.sub("_\\1", s).lower().strip("_ \n\t\r")
 
 
 def make_url(url: str, **kwargs: str) -> str:
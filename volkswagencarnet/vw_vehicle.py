@@ -4,13 +4,17 @@
 from __future__ import annotations
 
 import asyncio
-from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import wraps
 from json import dumps as to_json
 import logging
+from random import random
+from sys import intern
+from time import monotonic
 
 from .vw_const import Services, VehicleStatusParameter as P
-from .vw_utilities import find_path, is_valid_path
+from .vw_utilities import PathCachingDict, find_first_path, find_path, is_valid_path
 
 # TODO
 # Images (https://emea.bff.cariad.digital/media/v2/vehicle-images/WVWZZZ3HZPK002581?resolution=3x)
@@ -22,39 +26,303 @@ BACKEND_RECEIVED_TIMESTAMP = "BACKEND_RECEIVED_TIMESTAMP"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Dashboard class, imported on first use
+_dashboard_class = None
+
 ENGINE_TYPE_ELECTRIC = "electric"
 ENGINE_TYPE_DIESEL = "diesel"
 ENGINE_TYPE_GASOLINE = "gasoline"
 ENGINE_TYPE_CNG = "cng"
 ENGINE_TYPE_HYBRID = "hybrid"
-ENGINE_TYPE_COMBUSTION = [
-    ENGINE_TYPE_DIESEL,
-    ENGINE_TYPE_GASOLINE,
-    ENGINE_TYPE_CNG,
-]
-ENGINE_TYPE_GAS = [ENGINE_TYPE_CNG]
+ENGINE_TYPE_COMBUSTION = frozenset(
+    {
+        ENGINE_TYPE_DIESEL,
+        ENGINE_TYPE_GASOLINE,
+        ENGINE_TYPE_CNG,
+    }
+)
+ENGINE_TYPE_GAS = frozenset({ENGINE_TYPE_CNG})
 DEFAULT_TARGET_TEMP = 24
 
+# Accepted actions and settings of the set_* methods
+START_STOP_ACTIONS = frozenset({"start", "stop"})
+LOCK_ACTIONS = frozenset({"lock", "unlock"})
+REDUCED_AC_CHARGING_SETTINGS = frozenset({"reduced", "maximum"})
+MAX_CHARGE_AMPERAGE_SETTINGS = frozenset({5, 10, 13, 32})
+CHARGING_CARE_SETTINGS = frozenset({"activated", "deactivated"})
+CLIMATISATION_SWITCH_SETTINGS = frozenset(
+    {
+        "climatisation_without_external_power",
+        "auxiliary_air_conditioning",
+        "automatic_window_heating",
+        "zone_front_left",
+        "zone_front_right",
+    }
+)
+
+# Reported states that count as active
+EXTERNAL_POWER_STATES = frozenset({"stationConnected", "available", "ready"})
+ELECTRIC_CLIMATISATION_STATES = frozenset({"ventilation", "heating", "cooling", "on"})
+AUXILIARY_CLIMATISATION_STATES = frozenset({"heating", "heatingAuxiliary", "on"})
+
+# Display names of reported charger types
+CHARGER_TYPES = {"ac": "AC", "dc": "DC"}
+# Reported max AC charging current settings
+CHARGE_MAX_AC_STATES = frozenset({"reduced", "maximum", "invalid"})
+
+# Services fetched in one selective status request on every update
+SELECTIVE_STATUS_SERVICES = [
+    Services.ACCESS,
+    Services.BATTERY_CHARGING_CARE,
+    Services.BATTERY_SUPPORT,
+    Services.CHARGING,
+    Services.CLIMATISATION,
+    Services.CLIMATISATION_TIMERS,
+    Services.DEPARTURE_PROFILES,
+    Services.DEPARTURE_TIMERS,
+    Services.FUEL_STATUS,
+    Services.MEASUREMENTS,
+    Services.VEHICLE_LIGHTS,
+    Services.VEHICLE_HEALTH_INSPECTION,
+    Services.USER_CAPABILITIES,
+]
+
+# Minimum number of seconds between two vehicle updates
+MIN_UPDATE_INTERVAL = 30
+
+# Polling of pending requests backs off exponentially from the initial delay
+REQUEST_POLL_INITIAL_DELAY = 1
+REQUEST_POLL_MAX_DELAY = 10
+# Seconds to wait for the result of a request before giving up
+REQUEST_POLL_TIMEOUT = 170
+# Requests older than this are no longer considered to be in progress
+REQUEST_IN_PROGRESS_TIMEOUT = timedelta(minutes=3)
+# Topics of the requests reported in request_results
+REQUEST_RESULT_TOPICS = frozenset(
+    {
+        "departuretimer",
+        "batterycharge",
+        "climatisation",
+        "refresh",
+        "lock",
+    }
+)
+
+# Windows taken into account for the combined windows state
+_SIDE_WINDOWS = ("frontLeft", "frontRight", "rearLeft", "rearRight")
+
+# State paths shared by several properties
+_ACCESS_DOORS_PATH = f"{Services.ACCESS}.accessStatus.value.doors"
+_ACCESS_WINDOWS_PATH = f"{Services.ACCESS}.accessStatus.value.windows"
+_ACCESS_TIMESTAMP_PATH = f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
+_DOOR_LOCK_STATUS_PATH = f"{Services.ACCESS}.accessStatus.value.doorLockStatus"
+_FUEL_STATUS_CAR_TYPE_PATH = f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
+_FUEL_STATUS_TIMESTAMP_PATH = (
+    f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp"
+)
+_FUEL_STATUS_PRIMARY_FUEL_LEVEL_PATH = (
+    f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.currentFuelLevel_pct"
+)
+_FUEL_STATUS_PRIMARY_ENGINE_TYPE_PATH = (
+    f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.type"
+)
+_FUEL_STATUS_SECONDARY_ENGINE_TYPE_PATH = (
+    f"{Services.FUEL_STATUS}.rangeStatus.value.secondaryEngine.type"
+)
+_FUEL_LEVEL_CAR_TYPE_PATH = f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
+_FUEL_LEVEL_TIMESTAMP_PATH = (
+    f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carCapturedTimestamp"
+)
+_PRIMARY_ENGINE_TYPE_PATH = (
+    f"{Services.MEASUREMENTS}.fuelLevelStatus.value.primaryEngineType"
+)
+_SECONDARY_ENGINE_TYPE_PATH = (
+    f"{Services.MEASUREMENTS}.fuelLevelStatus.value.secondaryEngineType"
+)
+_RANGE_TIMESTAMP_PATH = (
+    f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp"
+)
+_DIESEL_RANGE_PATH = f"{Services.MEASUREMENTS}.rangeStatus.value.dieselRange"
+_GASOLINE_RANGE_PATH = f"{Services.MEASUREMENTS}.rangeStatus.value.gasolineRange"
+_CNG_RANGE_PATH = f"{Services.MEASUREMENTS}.rangeStatus.value.cngRange"
+_TOTAL_RANGE_PATH = f"{Services.MEASUREMENTS}.rangeStatus.value.totalRange_km"
+_ELECTRIC_RANGE_PATH = f"{Services.MEASUREMENTS}.rangeStatus.value.electricRange"
+_FUEL_LEVEL_PATH = f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentFuelLevel_pct"
+_CNG_LEVEL_PATH = f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentCngLevel_pct"
+_CHARGING_STATUS_TIMESTAMP_PATH = (
+    f"{Services.CHARGING}.chargingStatus.value.carCapturedTimestamp"
+)
+_CHARGING_SETTINGS_TIMESTAMP_PATH = (
+    f"{Services.CHARGING}.chargingSettings.value.carCapturedTimestamp"
+)
+_CHARGING_STATE_PATH = f"{Services.CHARGING}.chargingStatus.value.chargingState"
+_AUTO_UNLOCK_PLUG_PATH = (
+    f"{Services.CHARGING}.chargingSettings.value.autoUnlockPlugWhenChargedAC"
+)
+_PLUG_STATUS_TIMESTAMP_PATH = (
+    f"{Services.CHARGING}.plugStatus.value.carCapturedTimestamp"
+)
+_CLIMATISATION_STATE_PATH = (
+    f"{Services.CLIMATISATION}.climatisationStatus.value.climatisationState"
+)
+_CLIMATISATION_STATUS_TIMESTAMP_PATH = (
+    f"{Services.CLIMATISATION}.climatisationStatus.value.carCapturedTimestamp"
+)
+_CLIMATISATION_SETTINGS_TIMESTAMP_PATH = (
+    f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp"
+)
+_WINDOW_HEATING_STATUS_PATH = (
+    f"{Services.CLIMATISATION}.windowHeatingStatus.value.windowHeatingStatus"
+)
+_CLIMATISATION_TIMERS_PATH = (
+    f"{Services.CLIMATISATION_TIMERS}.climatisationTimersStatus.value.timers"
+)
+_AUXILIARY_HEATING_TIMERS_PATH = (
+    f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.timers"
+)
+_DEPARTURE_TIMERS_PATH = (
+    f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.timers"
+)
+_DEPARTURE_PROFILES_TIMERS_PATH = (
+    f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.timers"
+)
+_DEPARTURE_PROFILES_PATH = (
+    f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.profiles"
+)
+_AUXILIARY_HEATING_STATE_PATH = (
+    f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.climatisationState"
+)
+_AUXILIARY_HEATING_TIMESTAMP_PATH = (
+    f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.carCapturedTimestamp"
+)
+_AUXILIARY_HEATING_REMAINING_TIME_PATH = (
+    f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.remainingClimatisationTime_min"
+)
+_AUXILIARY_HEATING_DURATION_PATH = (
+    f"{Services.CLIMATISATION}.climatisationSettings.value.auxiliaryHeatingSettings.duration_min"
+)
+_USER_CAPABILITIES_PATH = f"{Services.USER_CAPABILITIES}.capabilitiesStatus.value"
+_WINDOW_HEATING_TIMESTAMP_PATH = (
+    f"{Services.CLIMATISATION}.windowHeatingStatus.value.carCapturedTimestamp"
+)
+_AUXILIARY_HEATING_TIMERS_TIMESTAMP_PATH = (
+    f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.carCapturedTimestamp"
+)
+_DEPARTURE_TIMERS_TIMESTAMP_PATH = (
+    f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.carCapturedTimestamp"
+)
+_DEPARTURE_PROFILES_TIMESTAMP_PATH = (
+    f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.carCapturedTimestamp"
+)
+_MAINTENANCE_TIMESTAMP_PATH = (
+    f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.carCapturedTimestamp"
+)
+
+
+def _cached_by_state(func):
+    """Turn func into a property that is memoized until the vehicle state changes."""
+
+    @wraps(func)
+    def getter(self):
+        cache = self._states.cache
+        try:
+            return cache[func]
+        except KeyError:
+            value = cache[func] = func(self)
+            return value
+
+    return property(getter)
+
+
+def _status_by_name(items) -> dict[str, frozenset[str]]:
+    """Return status of windows or doors by name, keeping the first of each name.
+
+    Names and statuses are interned so lookups with literals compare by identity.
+    """
+    statuses: dict[str, frozenset[str]] = {}
+    for item in items:
+        name = intern(item["name"])
+        if name not in statuses:
+            statuses[name] = frozenset(map(intern, item["status"]))
+    return statuses
+
+
+def _named_property(getter, name: str, doc: str) -> property:
+    """Return property reading the state of name with getter."""
+    return property(lambda self: getter(self, name), doc=doc)
+
+
+def _supported_property(supported, name: str) -> property:
+    """Return memoized property telling if the state of name is supported."""
+
+    def is_supported(self) -> bool:
+        """Return true if supported."""
+        return supported(self, name)
+
+    return _cached_by_state(is_supported)
+
+
+def _jittered(delay: float) -> float:
+    """Return delay randomized by +/- 50% to spread out concurrent polls."""
+    return delay * (0.5 + random())
+
+
+@dataclass(slots=True)
+class RequestState:
+    """Status of the latest request for a topic."""
+
+    status: str = ""
+    timestamp: datetime | None = None
+    id: str | int | None = None
+
+    def update(self, status: str, request_id: str | int | None = None) -> None:
+        """Record new status of the request."""
+        self.status = status
+        self.timestamp = datetime.now(UTC)
+        self.id = request_id
+
 
 class Vehicle:
     """Vehicle contains the state of sensors and methods for interacting with the car."""
 
-    def __init__(self, conn, url) -> None:
+    __slots__ = (
+        "_connection",
+        "_url",
+        "_min_update_interval",
+        "_last_update_monotonic",
+        "_last_update_time",
+        "_homeregion",
+        "_discovered",
+        "_states",
+        "_requests",
+        "_requests_latest",
+        "_requests_state",
+        "_services",
+        "_supports_start_window_heating",
+    )
+
+    def __init__(
+        self, conn, url, min_update_interval: float = MIN_UPDATE_INTERVAL
+    ) -> None:
         """Initialize the Vehicle with default values."""
         self._connection = conn
         self._url = url
+        self._min_update_interval = min_update_interval
+        self._last_update_monotonic: float | None = None
         self._homeregion = "https://msg.volkswagen.de"
         self._discovered = False
-        self._states = {}
-        self._requests: dict[str, object] = {
-            "departuretimer": {"status": "", "timestamp": datetime.now(UTC)},
-            "batterycharge": {"status": "", "timestamp": datetime.now(UTC)},
-            "climatisation": {"status": "", "timestamp": datetime.now(UTC)},
-            "refresh": {"status": "", "timestamp": datetime.now(UTC)},
-            "lock": {"status": "", "timestamp": datetime.now(UTC)},
-            "latest": "",
-            "state": "",
+        self._states = PathCachingDict()
+        now = datetime.now(UTC)
+        self._last_update_time = now
+        self._requests: dict[str, RequestState] = {
+            "departuretimer": RequestState(timestamp=now),
+            "batterycharge": RequestState(timestamp=now),
+            "climatisation": RequestState(timestamp=now),
+            "refresh": RequestState(timestamp=now),
+            "lock": RequestState(timestamp=now),
         }
+        self._requests_latest = ""
+        self._requests_state = ""
 
         # API Endpoints that might be enabled for car (that we support)
         self._services: dict[str, dict[str, object]] = {
@@ -74,16 +342,31 @@ class Vehicle:
             Services.USER_CAPABILITIES: {"active": False},
             Services.PARAMETERS: {},
         }
+        self._supports_start_window_heating = False
+
+    def _request(self, topic: str) -> RequestState:
+        """Return status of requests for topic, adding it if not yet known."""
+        try:
+            return self._requests[topic]
+        except KeyError:
+            request = self._requests[topic] = RequestState()
+            return request
+
+    def _request_status(self, topic: str) -> str:
+        """Return status of the latest request for topic, or "None" if unknown."""
+        request = self._requests.get(topic)
+        return request.status if request else "None"
 
     def _in_progress(self, topic: str, unknown_offset: int = 0) -> bool:
         """Check if request is already in progress."""
-        if self._requests.get(topic, {}).get("id", False):
-            timestamp = self._requests.get(topic, {}).get(
-                "timestamp",
-                datetime.now(UTC) - timedelta(minutes=unknown_offset),
-            )
-            if timestamp + timedelta(minutes=3) < datetime.now(UTC):
-                self._requests.get(topic, {}).pop("id")
+        request = self._requests.get(topic)
+        if request and request.id:
+            if request.timestamp is None:
+                elapsed = timedelta(minutes=unknown_offset)
+            else:
+                elapsed = datetime.now(UTC) - request.timestamp
+            if elapsed > REQUEST_IN_PROGRESS_TIMEOUT:
+                request.id = None
             else:
                 _LOGGER.info("Action (%s) already in progress", topic)
                 return True
@@ -93,11 +376,9 @@ class Vehicle:
         self, response, topic: str, error_msg: str | None = None
     ) -> bool:
         """Handle errors in response and get requests remaining."""
+        request = self._request(topic)
         if not response:
-            self._requests[topic] = {
-                "status": "Failed",
-                "timestamp": datetime.now(UTC),
-            }
+            request.update("Failed")
             _LOGGER.error(
                 error_msg
                 if error_msg is not None
@@ -109,20 +390,13 @@ class Vehicle:
                 if error_msg is not None
                 else f"Failed to perform {topic} action"
             )
-        self._requests[topic] = {
-            "timestamp": datetime.now(UTC),
-            "status": response.get("state", "Unknown"),
-            "id": response.get("id", 0),
-        }
+        request.update(response.get("state", "Unknown"), response.get("id", 0))
         if response.get("state", None) == "Throttled":
             status = "Throttled"
             _LOGGER.warning("Request throttled (%s)", topic)
         else:
             status = await self.wait_for_request(request=response.get("id", 0))
-        self._requests[topic] = {
-            "status": status,
-            "timestamp": datetime.now(UTC),
-        }
+        request.update(status)
         return True
 
     # API get and set functions #
@@ -146,39 +420,37 @@ class Vehicle:
                 "Could not determine available API endpoints for %s", self.vin
             )
             self._discovered = True
+            self._supports_start_window_heating = self._discover_window_heating()
             return
 
+        services = self._services
         for service_id, service in capabilities_list.items():
-            if service_id not in self._services:
+            if service_id not in services:
                 continue
 
             service_name = service.get("id", "Unknown Service")
-            data = {}
 
             if service.get("isEnabled", False):
-                data["active"] = True
                 _LOGGER.debug("Discovered enabled service: %s", service_name)
-
-                expiration_date = service.get("expirationDate", None)
-                if expiration_date:
+                operations = service.get("operations") or {}
+                data = {
+                    "active": True,
+                    "operations": [op.get("id") for op in operations.values()],
+                    "parameters": service.get("parameters", []),
+                }
+                if expiration_date := service.get("expirationDate"):
                     data["expiration"] = expiration_date
 
-                operations = service.get("operations", {})
-                data["operations"] = [op.get("id", None) for op in operations.values()]
-
-                parameters = service.get("parameters", [])
-                data["parameters"] = parameters
-
             else:
                 reason = service.get("status", "Unknown reason")
                 _LOGGER.debug(
                     "Service: %s is disabled due to: %s", service_name, reason
                 )
-                data["active"] = False
+                data = {"active": False}
 
             # Update the service data
             try:
-                self._services[service_name].update(data)
+                services[service_name].update(data)
             except Exception as error:  # pylint: disable=broad-exception-caught
                 _LOGGER.warning(
                     'Exception "%s" while updating service "%s": %s',
@@ -189,122 +461,167 @@ class Vehicle:
 
         _LOGGER.debug("API endpoints: %s", self._services)
         self._discovered = True
+        self._supports_start_window_heating = self._discover_window_heating()
 
-    async def update(self):
-        """Try to fetch data for all known API endpoints."""
-        if not self._discovered:
-            await self.discover()
-        if not self.deactivated:
-            await asyncio.gather(
-                self.get_selectivestatus(
-                    [
-                        Services.ACCESS,
-                        Services.BATTERY_CHARGING_CARE,
-                        Services.BATTERY_SUPPORT,
-                        Services.CHARGING,
-                        Services.CLIMATISATION,
-                        Services.CLIMATISATION_TIMERS,
-                        Services.DEPARTURE_PROFILES,
-                        Services.DEPARTURE_TIMERS,
-                        Services.FUEL_STATUS,
-                        Services.MEASUREMENTS,
-                        Services.VEHICLE_LIGHTS,
-                        Services.VEHICLE_HEALTH_INSPECTION,
-                        Services.USER_CAPABILITIES,
-                    ]
-                ),
-                self.get_vehicle(),
-                self.get_parkingposition(),
-                self.get_trip_last(),
+    def _discover_window_heating(self) -> bool:
+        """Return true if the discovered services allow starting window heating."""
+        # ID models detection
+        if (
+            self._services[Services.PARAMETERS].get(
+                "supportsStartWindowHeating", "false"
             )
-            await asyncio.gather(self.get_service_status())
-        else:
-            _LOGGER.info("Vehicle with VIN %s is deactivated", self.vin)
+            == "true"
+        ):
+            return True
+        # "Legacy" models detection
+        parameters = self._services[Services.CLIMATISATION].get("parameters", None)
+        if parameters:
+            for parameter in parameters:
+                if (
+                    parameter["key"] == "supportsStartWindowHeating"
+                    and parameter["value"] == "true"
+                ):
+                    return True
+        return False
+
+    async def update(self, force: bool = False):
+        """Try to fetch data for all known API endpoints.
+
+        Calls within min_update_interval seconds of the last update are
+        skipped unless force is set, as refreshes after actions should be.
+        """
+        if (
+            not force
+            and self._last_update_monotonic is not None
+            and monotonic() - self._last_update_monotonic < self._min_update_interval
+        ):
+            _LOGGER.debug("Skipping update of %s, data is still fresh", self.vin)
+            return
+        states = {}
+        tasks: list[asyncio.Task] = []
+        try:
+            if not self._discovered:
+                # Master data does not depend on capabilities, fetch it during discovery
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self.discover())
+                    tasks.append(tg.create_task(self.get_vehicle()))
+            if not self.deactivated:
+                vehicle_fetched = bool(tasks)
+                # A failing request cancels the others instead of waiting for them
+                async with asyncio.TaskGroup() as tg:
+                    tasks.append(
+                        tg.create_task(
+                            self.get_selectivestatus(SELECTIVE_STATUS_SERVICES)
+                        )
+                    )
+                    tasks.append(tg.create_task(self.get_parkingposition()))
+                    tasks.append(tg.create_task(self.get_trip_last()))
+                    if not vehicle_fetched:
+                        tasks.append(tg.create_task(self.get_vehicle()))
+                states.update(await self.get_service_status())
+            else:
+                _LOGGER.info("Vehicle with VIN %s is deactivated", self.vin)
+        except* Exception as eg:
+            # Callers expect the error of the failed request, not a group
+            raise eg.exceptions[0]
+        finally:
+            # Data fetched before a failure is still merged. Everything is merged
+            # at once so cached lookups are invalidated only once.
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception() is None:
+                    states.update(task.result())
+            self._states.update(states)
+        self._last_update_monotonic = monotonic()
+        self._last_update_time = datetime.now(UTC)
 
     # Data collection functions
-    async def get_selectivestatus(self, services):
+    async def get_selectivestatus(self, services) -> dict:
         """Fetch selective status for specified services."""
         data = await self._connection.getSelectiveStatus(self.vin, services)
-        if data:
-            self._states.update(data)
+        return data or {}
 
-    async def get_vehicle(self):
+    async def get_vehicle(self) -> dict:
         """Fetch car masterdata."""
         data = await self._connection.getVehicleData(self.vin)
-        if data:
-            self._states.update(data)
+        return data or {}
 
-    async def get_parkingposition(self):
+    async def get_parkingposition(self) -> dict:
         """Fetch parking position if supported."""
-        if self._services.get(Services.PARKING_POSITION, {}).get("active", False):
+        if self._services[Services.PARKING_POSITION]["active"]:
             data = await self._connection.getParkingPosition(self.vin)
-            if data:
-                self._states.update(data)
+            return data or {}
+        return {}
 
-    async def get_trip_last(self):
+    async def get_trip_last(self) -> dict:
         """Fetch last trip statistics if supported."""
-        if self._services.get(Services.TRIP_STATISTICS, {}).get("active", False):
+        if self._services[Services.TRIP_STATISTICS]["active"]:
             data = await self._connection.getTripLast(self.vin)
-            if data:
-                self._states.update(data)
+            return data or {}
+        return {}
 
-    async def get_service_status(self):
+    async def get_service_status(self) -> dict:
         """Fetch service status."""
         data = await self._connection.get_service_status()
-        if data:
-            self._states.update({Services.SERVICE_STATUS: data})
-
-    async def wait_for_request(self, request, retry_count=18):
-        """Update status of outstanding requests."""
-        retry_count -= 1
-        if retry_count == 0:
-            _LOGGER.info("Timeout while waiting for result of %s", request.requestId)
-            return "Timeout"
-        try:
-            status = await self._connection.get_request_status(self.vin, request)
-            _LOGGER.debug("Request ID %s: %s", request, status)
-            self._requests["state"] = status
-            if status == "In Progress":
-                await asyncio.sleep(10)
-                return await self.wait_for_request(request, retry_count)
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            _LOGGER.warning(
-                "Exception encountered while waiting for request status: %s", error
-            )
-            return "Exception"
-        else:
-            return status
-
-    async def wait_for_data_refresh(self, retry_count=18):
-        """Update status of outstanding requests."""
-        retry_count -= 1
-        if retry_count == 0:
-            _LOGGER.info("Timeout while waiting for data refresh")
-            return "Timeout"
-        try:
-            await self.get_selectivestatus([Services.MEASUREMENTS])
-            refresh_trigger_time = self._requests.get("refresh", {}).get("timestamp")
-            if self.last_connected < refresh_trigger_time:
-                await asyncio.sleep(10)
-                return await self.wait_for_data_refresh(retry_count)
+        return {Services.SERVICE_STATUS: data} if data else {}
 
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            _LOGGER.warning(
-                "Exception encountered while waiting for data refresh: %s", error
-            )
-            return "Exception"
-        else:
-            return "successful"
+    async def wait_for_request(self, request, *, timeout: float = REQUEST_POLL_TIMEOUT):
+        """Update status of outstanding requests, polling for up to timeout seconds."""
+        delay = REQUEST_POLL_INITIAL_DELAY
+        deadline = monotonic() + timeout
+        while True:
+            try:
+                status = await self._connection.get_request_status(self.vin, request)
+                _LOGGER.debug("Request ID %s: %s", request, status)
+                self._requests_state = status
+                if status != "In Progress":
+                    return status
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                _LOGGER.warning(
+                    "Exception encountered while waiting for request status: %s", error
+                )
+                return "Exception"
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(_jittered(delay), remaining))
+            delay = min(delay * 2, REQUEST_POLL_MAX_DELAY)
+        _LOGGER.info("Timeout while waiting for result of %s", request)
+        return "Timeout"
+
+    async def wait_for_data_refresh(self, *, timeout: float = REQUEST_POLL_TIMEOUT):
+        """Wait for refreshed data, polling for up to timeout seconds."""
+        delay = REQUEST_POLL_INITIAL_DELAY
+        deadline = monotonic() + timeout
+        while True:
+            try:
+                self._states.update(
+                    await self.get_selectivestatus([Services.MEASUREMENTS])
+                )
+                refresh_trigger_time = self._request("refresh").timestamp
+                if self.last_connected >= refresh_trigger_time:
+                    return "successful"
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                _LOGGER.warning(
+                    "Exception encountered while waiting for data refresh: %s", error
+                )
+                return "Exception"
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(_jittered(delay), remaining))
+            delay = min(delay * 2, REQUEST_POLL_MAX_DELAY)
+        _LOGGER.info("Timeout while waiting for data refresh")
+        return "Timeout"
 
     # Data set functions
     # Charging (BATTERYCHARGE)
     async def set_charger(self, action) -> bool:
         """Turn on/off charging."""
         if self.is_charging_supported:
-            if action not in ["start", "stop"]:
+            if action not in START_STOP_ACTIONS:
                 _LOGGER.error('Charging action "%s" is not supported', action)
                 raise Exception(f'Charging action "{action}" is not supported.')  # pylint: disable=broad-exception-raised
-            self._requests["latest"] = "Batterycharge"
+            self._requests_latest = "Batterycharge"
             response = await self._connection.setCharging(self.vin, (action == "start"))
             return await self._handle_response(
                 response=response,
@@ -322,10 +639,10 @@ class Vehicle:
             or self.is_battery_target_charge_level_supported
             or self.is_charge_max_ac_ampere_supported
         ):
-            if setting == "reduced_ac_charging" and value not in ["reduced", "maximum"]:
+            if setting == "reduced_ac_charging" and value not in REDUCED_AC_CHARGING_SETTINGS:
                 _LOGGER.error('Charging setting "%s" is not supported', value)
                 raise Exception(f'Charging setting "{value}" is not supported.')  # pylint: disable=broad-exception-raised
-            if setting == "max_charge_amperage" and int(value) not in [5, 10, 13, 32]:
+            if setting == "max_charge_amperage" and int(value) not in MAX_CHARGE_AMPERAGE_SETTINGS:
                 _LOGGER.error(
                     "Setting maximum charge amperage to %s is not supported", value
                 )
@@ -364,7 +681,7 @@ class Vehicle:
                     if setting == "max_charge_amperage"
                     else self.charge_max_ac_ampere
                 )
-            self._requests["latest"] = "Batterycharge"
+            self._requests_latest = "Batterycharge"
             response = await self._connection.setChargingSettings(self.vin, data)
             return await self._handle_response(
                 response=response,
@@ -377,11 +694,11 @@ class Vehicle:
     async def set_charging_care_settings(self, value):
         """Set charging care settings."""
         if self.is_battery_care_mode_supported:
-            if value not in ["activated", "deactivated"]:
+            if value not in CHARGING_CARE_SETTINGS:
                 _LOGGER.error('Charging care mode "%s" is not supported', value)
                 raise Exception(f'Charging care mode "{value}" is not supported.')  # pylint: disable=broad-exception-raised
             data = {"batteryCareMode": value}
-            self._requests["latest"] = "Batterycharge"
+            self._requests_latest = "Batterycharge"
             response = await self._connection.setChargingCareModeSettings(
                 self.vin, data
             )
@@ -400,7 +717,7 @@ class Vehicle:
                 _LOGGER.error('Battery support mode "%s" is not supported', value)
                 raise Exception(f'Battery support mode "{value}" is not supported.')  # pylint: disable=broad-exception-raised
             data = {"batterySupportEnabled": value}
-            self._requests["latest"] = "Batterycharge"
+            self._requests_latest = "Batterycharge"
             response = await self._connection.setReadinessBatterySupport(self.vin, data)
             return await self._handle_response(
                 response=response,
@@ -424,14 +741,7 @@ class Vehicle:
             if (
                 setting == "climatisation_target_temperature"
                 and 15.5 <= float(value) <= 30
-                or setting
-                in [
-                    "climatisation_without_external_power",
-                    "auxiliary_air_conditioning",
-                    "automatic_window_heating",
-                    "zone_front_left",
-                    "zone_front_right",
-                ]
+                or setting in CLIMATISATION_SWITCH_SETTINGS
                 and value in [True, False]
             ):
                 temperature = (
@@ -475,7 +785,7 @@ class Vehicle:
                         if setting == "zone_front_right"
                         else self.zone_front_right
                     )
-                self._requests["latest"] = "Climatisation"
+                self._requests_latest = "Climatisation"
                 response = await self._connection.setClimaterSettings(self.vin, data)
                 return await self._handle_response(
                     response=response,
@@ -490,10 +800,10 @@ class Vehicle:
     async def set_window_heating(self, action="stop"):
         """Turn on/off window heater."""
         if self.is_window_heater_supported:
-            if action not in ["start", "stop"]:
+            if action not in START_STOP_ACTIONS:
                 _LOGGER.error('Window heater action "%s" is not supported', action)
                 raise Exception(f'Window heater action "{action}" is not supported.')  # pylint: disable=broad-exception-raised
-            self._requests["latest"] = "Climatisation"
+            self._requests_latest = "Climatisation"
             response = await self._connection.setWindowHeater(
                 self.vin, (action == "start")
             )
@@ -530,7 +840,7 @@ class Vehicle:
             else:
                 _LOGGER.error("Invalid climatisation action: %s", action)
                 raise Exception(f"Invalid climatisation action: {action}")  # pylint: disable=broad-exception-raised
-            self._requests["latest"] = "Climatisation"
+            self._requests_latest = "Climatisation"
             response = await self._connection.setClimater(
                 self.vin, data, (action == "start")
             )
@@ -554,7 +864,7 @@ class Vehicle:
             else:
                 _LOGGER.error("Invalid auxiliary heater action: %s", action)
                 raise Exception(f"Invalid auxiliary heater action: {action}")  # pylint: disable=broad-exception-raised
-            self._requests["latest"] = "Climatisation"
+            self._requests_latest = "Climatisation"
             response = await self._connection.setAuxiliary(
                 self.vin, data, (action == "start")
             )
@@ -575,33 +885,20 @@ class Vehicle:
             data = None
             response = None
             if is_valid_path(
-                self.attrs,
-                f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.timers",
+                self.attrs, _DEPARTURE_PROFILES_TIMERS_PATH
             ) and is_valid_path(
                 self.attrs,
-                f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.profiles",
+                _DEPARTURE_PROFILES_PATH,
             ):
-                timers = find_path(
-                    self.attrs,
-                    f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.timers",
-                )
-                profiles = find_path(
-                    self.attrs,
-                    f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.profiles",
-                )
+                timers = find_path(self.attrs, _DEPARTURE_PROFILES_TIMERS_PATH)
+                profiles = find_path(self.attrs, _DEPARTURE_PROFILES_PATH)
                 for index, timer in enumerate(timers):
                     if timer.get("id", 0) == timer_id:
                         timers[index]["enabled"] = enable
                 data = {"timers": timers, "profiles": profiles}
                 response = await self._connection.setDepartureProfiles(self.vin, data)
-            if is_valid_path(
-                self.attrs,
-                f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.timers",
-            ):
-                timers = find_path(
-                    self.attrs,
-                    f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.timers",
-                )
+            if is_valid_path(self.attrs, _AUXILIARY_HEATING_TIMERS_PATH):
+                timers = find_path(self.attrs, _AUXILIARY_HEATING_TIMERS_PATH)
                 for index, timer in enumerate(timers):
                     if timer.get("id", 0) == timer_id:
                         timers[index]["enabled"] = enable
@@ -609,14 +906,8 @@ class Vehicle:
                 response = await self._connection.setAuxiliaryHeatingTimers(
                     self.vin, data
                 )
-            if is_valid_path(
-                self.attrs,
-                f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.timers",
-            ):
-                timers = find_path(
-                    self.attrs,
-                    f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.timers",
-                )
+            if is_valid_path(self.attrs, _DEPARTURE_TIMERS_PATH):
+                timers = find_path(self.attrs, _DEPARTURE_TIMERS_PATH)
                 for index, timer in enumerate(timers):
                     if timer.get("id", 0) == timer_id:
                         timers[index]["enabled"] = enable
@@ -641,10 +932,7 @@ class Vehicle:
                 raise Exception(
                     "Charging climatisation departure timers setting is not supported."
                 )
-            timers = find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION_TIMERS}.climatisationTimersStatus.value.timers",
-            )
+            timers = find_path(self.attrs, _CLIMATISATION_TIMERS_PATH)
             for index, timer in enumerate(timers):
                 if timer.get("id", 0) == timer_id:
                     timers[index]["enabled"] = enable
@@ -661,17 +949,17 @@ class Vehicle:
     # Lock (RLU)
     async def set_lock(self, action, spin):
         """Remote lock and unlock actions."""
-        if not self._services.get(Services.ACCESS, {}).get("active", False):
+        if not self._services[Services.ACCESS]["active"]:
             _LOGGER.info("Remote lock/unlock is not supported")
             raise Exception("Remote lock/unlock is not supported.")  # pylint: disable=broad-exception-raised
         if self._in_progress("lock", unknown_offset=-5):
             return False
-        if action not in ["lock", "unlock"]:
+        if action not in LOCK_ACTIONS:
             _LOGGER.error("Invalid lock action: %s", action)
             raise Exception(f"Invalid lock action: {action}")  # pylint: disable=broad-exception-raised
 
         try:
-            self._requests["latest"] = "Lock"
+            self._requests_latest = "Lock"
             response = await self._connection.setLock(
                 self.vin, (action == "lock"), spin
             )
@@ -682,10 +970,7 @@ class Vehicle:
             )
         except Exception as error:  # pylint: disable=broad-exception-caught
             _LOGGER.warning("Failed to %s vehicle - %s", action, error)
-            self._requests["lock"] = {
-                "status": "Exception",
-                "timestamp": datetime.now(UTC),
-            }
+            self._request("lock").update("Exception")
         raise Exception("Lock action failed")  # pylint: disable=broad-exception-raised
 
     # Refresh vehicle data (VSR)
@@ -694,16 +979,12 @@ class Vehicle:
         if self._in_progress("refresh", unknown_offset=-5):
             return False
         try:
-            self._requests["latest"] = "Refresh"
+            self._requests_latest = "Refresh"
             response = await self._connection.wakeUpVehicle(self.vin)
             if response:
                 if response.status == 204:
-                    self._requests["state"] = "in_progress"
-                    self._requests["refresh"] = {
-                        "timestamp": datetime.now(UTC),
-                        "status": "in_progress",
-                        "id": 0,
-                    }
+                    self._requests_state = "in_progress"
+                    self._request("refresh").update("in_progress", 0)
                     status = await self.wait_for_data_refresh()
                 elif response.status == 429:
                     status = "Throttled"
@@ -713,19 +994,13 @@ class Vehicle:
                         "Unable to refresh the data. Incorrect response code: %s",
                         response.status,
                     )
-                self._requests["state"] = status
-                self._requests["refresh"] = {
-                    "status": status,
-                    "timestamp": datetime.now(UTC),
-                }
+                self._requests_state = status
+                self._request("refresh").update(status)
                 return True
             _LOGGER.debug("Unable to refresh the data")
         except Exception as error:  # pylint: disable=broad-exception-caught
             _LOGGER.warning("Failed to execute data refresh - %s", error)
-            self._requests["refresh"] = {
-                "status": "Exception",
-                "timestamp": datetime.now(UTC),
-            }
+            self._request("refresh").update("Exception")
         raise Exception("Data refresh failed")  # pylint: disable=broad-exception-raised
 
     # Vehicle class helpers #
@@ -758,17 +1033,20 @@ class Vehicle:
         """Check if access to service has expired."""
         try:
             now = datetime.now(UTC)
-            if self._services.get(service, {}).get("expiration", False):
-                expiration = self._services.get(service, {}).get("expiration", False)
-                if not expiration:
-                    expiration = datetime.neow(UTC) + timedelta(days=1)
-            else:
+            service_data = self._services.get(service, {})
+            expiration = service_data.get("expiration")
+            if not expiration:
                 _LOGGER.debug(
                     "Could not determine end of access for service %s, assuming it is valid",
                     service,
                 )
-                expiration = datetime.now(UTC) + timedelta(days=1)
-            expiration = expiration.replace(tzinfo=None)
+                return False
+            if isinstance(expiration, str):
+                # Parse once and keep the result for subsequent checks
+                expiration = datetime.fromisoformat(expiration)
+                if expiration.tzinfo is None:
+                    expiration = expiration.replace(tzinfo=UTC)
+                service_data["expiration"] = expiration
             if now >= expiration:
                 _LOGGER.warning("Access to %s has expired!", service)
                 self._discovered = False
@@ -788,9 +1066,13 @@ class Vehicle:
         :param config:
         :return:
         """
-        from .vw_dashboard import Dashboard  # pylint: disable=import-outside-toplevel
+        global _dashboard_class  # pylint: disable=global-statement
+        if _dashboard_class is None:
+            # Imported late as vw_dashboard depends on this module
+            from .vw_dashboard import Dashboard  # pylint: disable=import-outside-toplevel
 
-        return Dashboard(self, **config)
+            _dashboard_class = Dashboard
+        return _dashboard_class(self, **config)
 
     @property
     def vin(self) -> str:
@@ -810,7 +1092,7 @@ class Vehicle:
 
     # Information from vehicle states #
     # Car information
-    @property
+    @_cached_by_state
     def nickname(self) -> str | None:
         """Return nickname of the vehicle.
 
@@ -818,7 +1100,7 @@ class Vehicle:
         """
         return self.attrs.get("vehicle", {}).get("nickname", None)
 
-    @property
+    @_cached_by_state
     def is_nickname_supported(self) -> bool:
         """Return true if naming the vehicle is supported.
 
@@ -826,7 +1108,7 @@ class Vehicle:
         """
         return self.attrs.get("vehicle", {}).get("nickname", False) is not False
 
-    @property
+    @_cached_by_state
     def deactivated(self) -> bool | None:
         """Return true if service is deactivated.
 
@@ -834,7 +1116,7 @@ class Vehicle:
         """
         return self.attrs.get("carData", {}).get("deactivated", None)
 
-    @property
+    @_cached_by_state
     def is_deactivated_supported(self) -> bool:
         """Return true if service deactivation status is supported.
 
@@ -842,33 +1124,33 @@ class Vehicle:
         """
         return self.attrs.get("carData", {}).get("deactivated", False) is True
 
-    @property
+    @_cached_by_state
     def model(self) -> str | None:
         """Return model."""
         return self.attrs.get("vehicle", {}).get("model", None)
 
-    @property
+    @_cached_by_state
     def is_model_supported(self) -> bool:
         """Return true if model is supported."""
         return self.attrs.get("vehicle", {}).get("modelName", False) is not False
 
-    @property
+    @_cached_by_state
     def model_year(self) -> bool | None:
         """Return model year."""
         return self.attrs.get("vehicle", {}).get("modelYear", None)
 
-    @property
+    @_cached_by_state
     def is_model_year_supported(self) -> bool:
         """Return true if model year is supported."""
         return self.attrs.get("vehicle", {}).get("modelYear", False) is not False
 
-    @property
+    @_cached_by_state
     def model_image(self) -> str:
         # Not implemented
         """Return vehicle model image."""
         return self.attrs.get("imageUrl")
 
-    @property
+    @_cached_by_state
     def is_model_image_supported(self) -> bool:
         """Return true if vehicle model image is supported.
 
@@ -890,7 +1172,9 @@ class Vehicle:
         lights_on_count = 0
         for light in lights:
             if light["status"] == "on":
-                lights_on_count = lights_on_count + 1
+                lights_on_count += 1
+                if lights_on_count > 2:
+                    return False
         return lights_on_count == 2
 
     @property
@@ -903,7 +1187,7 @@ class Vehicle:
             .get("carCapturedTimestamp")
         )
 
-    @property
+    @_cached_by_state
     def is_parking_light_supported(self) -> bool:
         """Return true if parking light is supported."""
         return self.attrs.get(Services.VEHICLE_LIGHTS, False) and is_valid_path(
@@ -911,7 +1195,7 @@ class Vehicle:
         )
 
     # Connection status
-    @property
+    @_cached_by_state
     def last_connected(self) -> datetime:
         """Return when vehicle was last connected to connect servers in local time."""
         # this field is only a dirty hack, because there is no overarching information for the car anymore,
@@ -921,46 +1205,29 @@ class Vehicle:
         if self.is_battery_level_supported and self.charging:
             return self.battery_level_last_updated
         if self.is_distance_supported:
-            if isinstance(self.distance_last_updated, str):
-                return (
-                    datetime.strptime(
-                        self.distance_last_updated, "%Y-%m-%dT%H:%M:%S.%fZ"
-                    )
-                    .replace(microsecond=0)
-                    .replace(tzinfo=UTC)
-                )
-            return self.distance_last_updated
+            distance_last_updated = self.distance_last_updated
+            if isinstance(distance_last_updated, datetime):
+                # Timestamps are parsed when loading the response
+                return distance_last_updated.replace(microsecond=0)
+            return distance_last_updated
 
-    @property
-    def last_connected_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        if self.is_battery_level_supported and self.charging:
-            return self.battery_level_last_updated
-        if self.is_distance_supported:
-            if isinstance(self.distance_last_updated, str):
-                return (
-                    datetime.strptime(
-                        self.distance_last_updated, "%Y-%m-%dT%H:%M:%S.%fZ"
-                    )
-                    .replace(microsecond=0)
-                    .replace(tzinfo=UTC)
-                )
-            return self.distance_last_updated
+    # The value already is a timestamp, share the memoized result
+    last_connected_last_updated = last_connected
 
-    @property
+    @_cached_by_state
     def is_last_connected_supported(self) -> bool:
         """Return if when vehicle was last connected to connect servers is supported."""
         return self.is_battery_level_supported or self.is_distance_supported
 
     # Service information
-    @property
+    @_cached_by_state
     def distance(self) -> int | None:
         """Return vehicle odometer."""
         return find_path(
             self.attrs, f"{Services.MEASUREMENTS}.odometerStatus.value.odometer"
         )
 
-    @property
+    @_cached_by_state
     def distance_last_updated(self) -> datetime:
         """Return last updated timestamp."""
         return find_path(
@@ -968,7 +1235,7 @@ class Vehicle:
             f"{Services.MEASUREMENTS}.odometerStatus.value.carCapturedTimestamp",
         )
 
-    @property
+    @_cached_by_state
     def is_distance_supported(self) -> bool:
         """Return true if odometer is supported."""
         return is_valid_path(
@@ -983,15 +1250,12 @@ class Vehicle:
             f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.inspectionDue_days",
         )
 
-    @property
+    @_cached_by_state
     def service_inspection_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.carCapturedTimestamp",
-        )
+        return find_path(self.attrs, _MAINTENANCE_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_service_inspection_supported(self) -> bool:
         """Return true if days to service inspection is supported.
 
@@ -1010,15 +1274,9 @@ class Vehicle:
             f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.inspectionDue_km",
         )
 
-    @property
-    def service_inspection_distance_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.carCapturedTimestamp",
-        )
+    service_inspection_distance_last_updated = service_inspection_last_updated
 
-    @property
+    @_cached_by_state
     def is_service_inspection_distance_supported(self) -> bool:
         """Return true if distance to service inspection is supported.
 
@@ -1037,15 +1295,9 @@ class Vehicle:
             f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.oilServiceDue_days",
         )
 
-    @property
-    def oil_inspection_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.carCapturedTimestamp",
-        )
+    oil_inspection_last_updated = service_inspection_last_updated
 
-    @property
+    @_cached_by_state
     def is_oil_inspection_supported(self) -> bool:
         """Return true if days to oil inspection is supported.
 
@@ -1066,15 +1318,9 @@ class Vehicle:
             f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.oilServiceDue_km",
         )
 
-    @property
-    def oil_inspection_distance_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.VEHICLE_HEALTH_INSPECTION}.maintenanceStatus.value.carCapturedTimestamp",
-        )
+    oil_inspection_distance_last_updated = service_inspection_last_updated
 
-    @property
+    @_cached_by_state
     def is_oil_inspection_distance_supported(self) -> bool:
         """Return true if oil inspection distance is supported.
 
@@ -1094,15 +1340,12 @@ class Vehicle:
             self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.adBlueRange"
         )
 
-    @property
+    @_cached_by_state
     def adblue_level_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp",
-        )
+        return find_path(self.attrs, _RANGE_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_adblue_level_supported(self) -> bool:
         """Return true if adblue level is supported."""
         return is_valid_path(
@@ -1110,27 +1353,21 @@ class Vehicle:
         )
 
     # Charger related states for EV and PHEV
-    @property
+    @_cached_by_state
     def charging(self) -> bool:
         """Return charging state."""
-        cstate = find_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargingState"
-        )
+        cstate = find_path(self.attrs, _CHARGING_STATE_PATH)
         return cstate == "charging"
 
-    @property
+    @_cached_by_state
     def charging_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.carCapturedTimestamp"
-        )
+        return find_path(self.attrs, _CHARGING_STATUS_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_charging_supported(self) -> bool:
         """Return true if charging is supported."""
-        return is_valid_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargingState"
-        )
+        return is_valid_path(self.attrs, _CHARGING_STATE_PATH)
 
     @property
     def charging_power(self) -> int:
@@ -1139,14 +1376,9 @@ class Vehicle:
             self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargePower_kW"
         )
 
-    @property
-    def charging_power_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.carCapturedTimestamp"
-        )
+    charging_power_last_updated = charging_last_updated
 
-    @property
+    @_cached_by_state
     def is_charging_power_supported(self) -> bool:
         """Return true if charging power is supported."""
         return is_valid_path(
@@ -1160,61 +1392,48 @@ class Vehicle:
             self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargeRate_kmph"
         )
 
-    @property
-    def charging_rate_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.carCapturedTimestamp"
-        )
+    charging_rate_last_updated = charging_last_updated
 
-    @property
+    @_cached_by_state
     def is_charging_rate_supported(self) -> bool:
         """Return true if charging rate is supported."""
         return is_valid_path(
             self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargeRate_kmph"
         )
 
-    @property
+    @_cached_by_state
     def charger_type(self) -> str:
         """Return charger type."""
         charger_type = find_path(
             self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargeType"
         )
-        if charger_type == "ac":
-            return "AC"
-        if charger_type == "dc":
-            return "DC"
-        return "Unknown"
+        return CHARGER_TYPES.get(charger_type, "Unknown")
 
-    @property
-    def charger_type_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.carCapturedTimestamp"
-        )
+    # Same source as charging_last_updated, share the memoized value
+    charger_type_last_updated = charging_last_updated
 
-    @property
+    @_cached_by_state
     def is_charger_type_supported(self) -> bool:
         """Return true if charger type is supported."""
         return is_valid_path(
             self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargeType"
         )
 
-    @property
+    @_cached_by_state
     def battery_level(self) -> int:
         """Return battery level."""
         return find_path(
             self.attrs, f"{Services.CHARGING}.batteryStatus.value.currentSOC_pct"
         )
 
-    @property
+    @_cached_by_state
     def battery_level_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
         return find_path(
             self.attrs, f"{Services.CHARGING}.batteryStatus.value.carCapturedTimestamp"
         )
 
-    @property
+    @_cached_by_state
     def is_battery_level_supported(self) -> bool:
         """Return true if battery level is supported."""
         return is_valid_path(
@@ -1228,22 +1447,19 @@ class Vehicle:
             self.attrs, f"{Services.CHARGING}.chargingSettings.value.targetSOC_pct"
         )
 
-    @property
+    @_cached_by_state
     def battery_target_charge_level_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.CHARGING}.chargingSettings.value.carCapturedTimestamp",
-        )
+        return find_path(self.attrs, _CHARGING_SETTINGS_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_battery_target_charge_level_supported(self) -> bool:
         """Return true if target charge level is supported."""
         return is_valid_path(
             self.attrs, f"{Services.CHARGING}.chargingSettings.value.targetSOC_pct"
         )
 
-    @property
+    @_cached_by_state
     def hv_battery_min_temperature(self) -> int:
         """Return HV battery min temperature."""
         return (
@@ -1264,7 +1480,7 @@ class Vehicle:
             f"{Services.MEASUREMENTS}.temperatureBatteryStatus.value.carCapturedTimestamp",
         )
 
-    @property
+    @_cached_by_state
     def is_hv_battery_min_temperature_supported(self) -> bool:
         """Return true if HV battery min temperature is supported."""
         return is_valid_path(
@@ -1272,7 +1488,7 @@ class Vehicle:
             f"{Services.MEASUREMENTS}.temperatureBatteryStatus.value.temperatureHvBatteryMin_K",
         )
 
-    @property
+    @_cached_by_state
     def hv_battery_max_temperature(self) -> int:
         """Return HV battery max temperature."""
         return (
@@ -1293,7 +1509,7 @@ class Vehicle:
             f"{Services.MEASUREMENTS}.temperatureBatteryStatus.value.carCapturedTimestamp",
         )
 
-    @property
+    @_cached_by_state
     def is_hv_battery_max_temperature_supported(self) -> bool:
         """Return true if HV battery max temperature is supported."""
         return is_valid_path(
@@ -1308,26 +1524,17 @@ class Vehicle:
             self.attrs, f"{Services.CHARGING}.chargingSettings.value.maxChargeCurrentAC"
         )
 
-    @property
-    def charge_max_ac_setting_last_updated(self) -> datetime:
-        """Return charger max ampere last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CHARGING}.chargingSettings.value.carCapturedTimestamp",
-        )
+    charge_max_ac_setting_last_updated = battery_target_charge_level_last_updated
 
-    @property
+    @_cached_by_state
     def is_charge_max_ac_setting_supported(self) -> bool:
         """Return true if Charger Max Ampere is supported."""
-        if is_valid_path(
-            self.attrs, f"{Services.CHARGING}.chargingSettings.value.maxChargeCurrentAC"
-        ):
-            value = find_path(
-                self.attrs,
-                f"{Services.CHARGING}.chargingSettings.value.maxChargeCurrentAC",
-            )
-            return value in ["reduced", "maximum", "invalid"]
-        return False
+        value = find_path(
+            self.attrs,
+            f"{Services.CHARGING}.chargingSettings.value.maxChargeCurrentAC",
+            default=None,
+        )
+        return value in CHARGE_MAX_AC_STATES
 
     @property
     def charge_max_ac_ampere(self) -> str | int:
@@ -1337,15 +1544,9 @@ class Vehicle:
             f"{Services.CHARGING}.chargingSettings.value.maxChargeCurrentAC_A",
         )
 
-    @property
-    def charge_max_ac_ampere_last_updated(self) -> datetime:
-        """Return charger max ampere last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CHARGING}.chargingSettings.value.carCapturedTimestamp",
-        )
+    charge_max_ac_ampere_last_updated = battery_target_charge_level_last_updated
 
-    @property
+    @_cached_by_state
     def is_charge_max_ac_ampere_supported(self) -> bool:
         """Return true if Charger Max Ampere is supported."""
         return is_valid_path(
@@ -1361,14 +1562,12 @@ class Vehicle:
         )
         return response == "locked"
 
-    @property
+    @_cached_by_state
     def charging_cable_locked_last_updated(self) -> datetime:
-        """Return plug locked state."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.plugStatus.value.carCapturedTimestamp"
-        )
+        """Return plug status last updated."""
+        return find_path(self.attrs, _PLUG_STATUS_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_charging_cable_locked_supported(self) -> bool:
         """Return true if plug locked state is supported."""
         return is_valid_path(
@@ -1383,14 +1582,9 @@ class Vehicle:
         )
         return response == "connected"
 
-    @property
-    def charging_cable_connected_last_updated(self) -> datetime:
-        """Return plug connected state last updated."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.plugStatus.value.carCapturedTimestamp"
-        )
+    charging_cable_connected_last_updated = charging_cable_locked_last_updated
 
-    @property
+    @_cached_by_state
     def is_charging_cable_connected_supported(self) -> bool:
         """Return true if supported."""
         return is_valid_path(
@@ -1400,46 +1594,30 @@ class Vehicle:
     @property
     def charging_time_left(self) -> int:
         """Return minutes to charging complete."""
-        if is_valid_path(
+        return find_path(
             self.attrs,
             f"{Services.CHARGING}.chargingStatus.value.remainingChargingTimeToComplete_min",
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.CHARGING}.chargingStatus.value.remainingChargingTimeToComplete_min",
-            )
-        return None
-
-    @property
-    def charging_time_left_last_updated(self) -> datetime:
-        """Return minutes to charging complete last updated."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.carCapturedTimestamp"
+            default=None,
         )
 
-    @property
+    charging_time_left_last_updated = charging_last_updated
+
+    @_cached_by_state
     def is_charging_time_left_supported(self) -> bool:
         """Return true if charging is supported."""
-        return is_valid_path(
-            self.attrs, f"{Services.CHARGING}.chargingStatus.value.chargingState"
-        )
+        return is_valid_path(self.attrs, _CHARGING_STATE_PATH)
 
-    @property
+    @_cached_by_state
     def external_power(self) -> bool:
         """Return true if external power is connected."""
         check = find_path(
             self.attrs, f"{Services.CHARGING}.plugStatus.value.externalPower"
         )
-        return check in ["stationConnected", "available", "ready"]
+        return check in EXTERNAL_POWER_STATES
 
-    @property
-    def external_power_last_updated(self) -> datetime:
-        """Return external power last updated."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.plugStatus.value.carCapturedTimestamp"
-        )
+    external_power_last_updated = charging_cable_locked_last_updated
 
-    @property
+    @_cached_by_state
     def is_external_power_supported(self) -> bool:
         """External power supported."""
         return is_valid_path(
@@ -1456,7 +1634,7 @@ class Vehicle:
         """Return attribute last updated timestamp."""
         return self.charge_max_ac_setting_last_updated
 
-    @property
+    @_cached_by_state
     def is_reduced_ac_charging_supported(self) -> bool:
         """Return true if reduced charging is supported."""
         return self.is_charge_max_ac_setting_supported
@@ -1464,37 +1642,19 @@ class Vehicle:
     @property
     def auto_release_ac_connector_state(self) -> str:
         """Return auto release ac connector state value."""
-        return find_path(
-            self.attrs,
-            f"{Services.CHARGING}.chargingSettings.value.autoUnlockPlugWhenChargedAC",
-        )
+        return find_path(self.attrs, _AUTO_UNLOCK_PLUG_PATH)
 
     @property
     def auto_release_ac_connector(self) -> bool:
         """Return auto release ac connector state."""
-        return (
-            find_path(
-                self.attrs,
-                f"{Services.CHARGING}.chargingSettings.value.autoUnlockPlugWhenChargedAC",
-            )
-            == "permanent"
-        )
+        return find_path(self.attrs, _AUTO_UNLOCK_PLUG_PATH) == "permanent"
 
-    @property
-    def auto_release_ac_connector_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.CHARGING}.chargingSettings.value.carCapturedTimestamp",
-        )
+    auto_release_ac_connector_last_updated = battery_target_charge_level_last_updated
 
-    @property
+    @_cached_by_state
     def is_auto_release_ac_connector_supported(self) -> bool:
         """Return true if auto release ac connector is supported."""
-        return is_valid_path(
-            self.attrs,
-            f"{Services.CHARGING}.chargingSettings.value.autoUnlockPlugWhenChargedAC",
-        )
+        return is_valid_path(self.attrs, _AUTO_UNLOCK_PLUG_PATH)
 
     @property
     def battery_care_mode(self) -> bool:
@@ -1510,9 +1670,9 @@ class Vehicle:
     @property
     def battery_care_mode_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
-    @property
+    @_cached_by_state
     def is_battery_care_mode_supported(self) -> bool:
         """Return true if battery care mode is supported."""
         return is_valid_path(
@@ -1534,9 +1694,9 @@ class Vehicle:
     @property
     def optimised_battery_use_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
-    @property
+    @_cached_by_state
     def is_optimised_battery_use_supported(self) -> bool:
         """Return true if optimised battery use is supported."""
         return is_valid_path(
@@ -1548,37 +1708,35 @@ class Vehicle:
     def energy_flow(self):
         # TODO untouched # pylint: disable=fixme
         """Return true if energy is flowing through charging port."""
-        check = (
-            self.attrs.get("charger", {})
-            .get("status", {})
-            .get("chargingStatusData", {})
-            .get("energyFlow", {})
-            .get("content", "off")
-        )
-        return check == "on"
+        try:
+            return (
+                self.attrs["charger"]["status"]["chargingStatusData"]["energyFlow"][
+                    "content"
+                ]
+                == "on"
+            )
+        except (KeyError, TypeError):
+            return False
 
     @property
     def energy_flow_last_updated(self) -> datetime:
         # TODO untouched # pylint: disable=fixme
         """Return energy flow last updated."""
-        return (
-            self.attrs.get("charger", {})
-            .get("status", {})
-            .get("chargingStatusData", {})
-            .get("energyFlow", {})
-            .get("timestamp")
-        )
+        try:
+            return self.attrs["charger"]["status"]["chargingStatusData"]["energyFlow"][
+                "timestamp"
+            ]
+        except (KeyError, TypeError):
+            return None
 
-    @property
+    @_cached_by_state
     def is_energy_flow_supported(self) -> bool:
         # TODO untouched # pylint: disable=fixme
         """Energy flow supported."""
-        return (
-            self.attrs.get("charger", {})
-            .get("status", {})
-            .get("chargingStatusData", {})
-            .get("energyFlow", False)
-        )
+        try:
+            return self.attrs["charger"]["status"]["chargingStatusData"]["energyFlow"]
+        except (KeyError, TypeError):
+            return False
 
     # Vehicle location states
     @property
@@ -1589,13 +1747,13 @@ class Vehicle:
             if self.vehicle_moving:
                 output = {"lat": None, "lng": None, "timestamp": None}
             else:
-                lat = float(find_path(self.attrs, "parkingposition.lat"))
-                lng = float(find_path(self.attrs, "parkingposition.lon"))
-                parking_time = find_path(
-                    self.attrs, "parkingposition.carCapturedTimestamp"
-                )
-                output = {"lat": lat, "lng": lng, "timestamp": parking_time}
-        except Exception:  # pylint: disable=broad-exception-caught
+                parking_position = self.attrs["parkingposition"]
+                output = {
+                    "lat": float(parking_position["lat"]),
+                    "lng": float(parking_position["lon"]),
+                    "timestamp": parking_position.get("carCapturedTimestamp"),
+                }
+        except (KeyError, TypeError, ValueError):
             output = {
                 "lat": "?",
                 "lng": "?",
@@ -1605,11 +1763,12 @@ class Vehicle:
     @property
     def position_last_updated(self) -> datetime:
         """Return  position last updated."""
-        return self.attrs.get("parkingposition", {}).get(
-            "carCapturedTimestamp", "Unknown"
-        )
+        try:
+            return self.attrs["parkingposition"]["carCapturedTimestamp"]
+        except (KeyError, TypeError):
+            return "Unknown"
 
-    @property
+    @_cached_by_state
     def is_position_supported(self) -> bool:
         """Return true if position is available."""
         return is_valid_path(
@@ -1626,7 +1785,7 @@ class Vehicle:
         """Return attribute last updated timestamp."""
         return self.position_last_updated
 
-    @property
+    @_cached_by_state
     def is_vehicle_moving_supported(self) -> bool:
         """Return true if vehicle supports position."""
         return self.is_position_supported
@@ -1634,17 +1793,16 @@ class Vehicle:
     @property
     def parking_time(self) -> datetime:
         """Return timestamp of last parking time."""
-        parking_time_path = "parkingposition.carCapturedTimestamp"
-        if is_valid_path(self.attrs, parking_time_path):
-            return find_path(self.attrs, parking_time_path)
-        return None
+        return find_path(
+            self.attrs, "parkingposition.carCapturedTimestamp", default=None
+        )
 
     @property
     def parking_time_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
         return self.position_last_updated
 
-    @property
+    @_cached_by_state
     def is_parking_time_supported(self) -> bool:
         """Return true if vehicle parking timestamp is supported."""
         return self.is_position_supported
@@ -1656,12 +1814,8 @@ class Vehicle:
 
         :return:
         """
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.electricRange"
-        ):
-            return find_path(
-                self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.electricRange"
-            )
+        if is_valid_path(self.attrs, _ELECTRIC_RANGE_PATH):
+            return find_path(self.attrs, _ELECTRIC_RANGE_PATH)
         return find_path(
             self.attrs,
             f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.remainingRange_km",
@@ -1670,27 +1824,18 @@ class Vehicle:
     @property
     def electric_range_last_updated(self) -> datetime:
         """Return electric range last updated."""
-        if is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp",
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp",
-            )
-        return find_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp"
-        )
+        timestamp = find_path(self.attrs, _RANGE_TIMESTAMP_PATH, default=None)
+        if timestamp is None:
+            return find_path(self.attrs, _FUEL_STATUS_TIMESTAMP_PATH)
+        return timestamp
 
-    @property
+    @_cached_by_state
     def is_electric_range_supported(self) -> bool:
         """Return true if electric range is supported.
 
         :return:
         """
-        return is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.electricRange"
-        ) or (
+        return is_valid_path(self.attrs, _ELECTRIC_RANGE_PATH) or (
             self.is_car_type_electric
             and is_valid_path(
                 self.attrs,
@@ -1704,42 +1849,22 @@ class Vehicle:
 
         :return:
         """
-        DIESEL_RANGE = f"{Services.MEASUREMENTS}.rangeStatus.value.dieselRange"
-        GASOLINE_RANGE = f"{Services.MEASUREMENTS}.rangeStatus.value.gasolineRange"
-        CNG_RANGE = f"{Services.MEASUREMENTS}.rangeStatus.value.cngRange"
-        TOTAL_RANGE = f"{Services.MEASUREMENTS}.rangeStatus.value.totalRange_km"
-        if is_valid_path(self.attrs, CNG_RANGE):
-            return find_path(self.attrs, TOTAL_RANGE)
-        if is_valid_path(self.attrs, DIESEL_RANGE):
-            return find_path(self.attrs, DIESEL_RANGE)
-        if is_valid_path(self.attrs, GASOLINE_RANGE):
-            return find_path(self.attrs, GASOLINE_RANGE)
-        return -1
+        if is_valid_path(self.attrs, _CNG_RANGE_PATH):
+            return find_path(self.attrs, _TOTAL_RANGE_PATH)
+        return self.fuel_range
 
-    @property
-    def combustion_range_last_updated(self) -> datetime | None:
-        """Return combustion engine range last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp",
-        )
+    combustion_range_last_updated = adblue_level_last_updated
 
-    @property
+    @_cached_by_state
     def is_combustion_range_supported(self) -> bool:
         """Return true if combustion range is supported, i.e. false for EVs.
 
         :return:
         """
         return (
-            is_valid_path(
-                self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.dieselRange"
-            )
-            or is_valid_path(
-                self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.gasolineRange"
-            )
-            or is_valid_path(
-                self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.cngRange"
-            )
+            is_valid_path(self.attrs, _DIESEL_RANGE_PATH)
+            or is_valid_path(self.attrs, _GASOLINE_RANGE_PATH)
+            or is_valid_path(self.attrs, _CNG_RANGE_PATH)
         )
 
     @property
@@ -1748,32 +1873,20 @@ class Vehicle:
 
         :return:
         """
-        DIESEL_RANGE = f"{Services.MEASUREMENTS}.rangeStatus.value.dieselRange"
-        GASOLINE_RANGE = f"{Services.MEASUREMENTS}.rangeStatus.value.gasolineRange"
-        if is_valid_path(self.attrs, DIESEL_RANGE):
-            return find_path(self.attrs, DIESEL_RANGE)
-        if is_valid_path(self.attrs, GASOLINE_RANGE):
-            return find_path(self.attrs, GASOLINE_RANGE)
-        return -1
-
-    @property
-    def fuel_range_last_updated(self) -> datetime | None:
-        """Return fuel engine range last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp",
+        return find_first_path(
+            self.attrs, _DIESEL_RANGE_PATH, _GASOLINE_RANGE_PATH, default=-1
         )
 
-    @property
+    fuel_range_last_updated = adblue_level_last_updated
+
+    @_cached_by_state
     def is_fuel_range_supported(self) -> bool:
         """Return true if fuel range is supported, i.e. false for EVs.
 
         :return:
         """
-        return is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.dieselRange"
-        ) or is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.gasolineRange"
+        return is_valid_path(self.attrs, _DIESEL_RANGE_PATH) or is_valid_path(
+            self.attrs, _GASOLINE_RANGE_PATH
         )
 
     @property
@@ -1782,28 +1895,17 @@ class Vehicle:
 
         :return:
         """
-        CNG_RANGE = f"{Services.MEASUREMENTS}.rangeStatus.value.cngRange"
-        if is_valid_path(self.attrs, CNG_RANGE):
-            return find_path(self.attrs, CNG_RANGE)
-        return -1
+        return find_path(self.attrs, _CNG_RANGE_PATH, default=-1)
 
-    @property
-    def gas_range_last_updated(self) -> datetime | None:
-        """Return gas engine range last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp",
-        )
+    gas_range_last_updated = adblue_level_last_updated
 
-    @property
+    @_cached_by_state
     def is_gas_range_supported(self) -> bool:
         """Return true if gas range is supported, i.e. false for EVs.
 
         :return:
         """
-        return is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.cngRange"
-        )
+        return is_valid_path(self.attrs, _CNG_RANGE_PATH)
 
     @property
     def combined_range(self) -> int:
@@ -1811,27 +1913,17 @@ class Vehicle:
 
         :return:
         """
-        return find_path(
-            self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.totalRange_km"
-        )
+        return find_path(self.attrs, _TOTAL_RANGE_PATH)
 
-    @property
-    def combined_range_last_updated(self) -> datetime | None:
-        """Return combined range last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.rangeStatus.value.carCapturedTimestamp",
-        )
+    combined_range_last_updated = adblue_level_last_updated
 
-    @property
+    @_cached_by_state
     def is_combined_range_supported(self) -> bool:
         """Return true if combined range is supported.
 
         :return:
         """
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.rangeStatus.value.totalRange_km"
-        ):
+        if is_valid_path(self.attrs, _TOTAL_RANGE_PATH):
             return (
                 self.is_electric_range_supported and self.is_combustion_range_supported
             )
@@ -1848,14 +1940,9 @@ class Vehicle:
             f"{Services.CHARGING}.batteryStatus.value.cruisingRangeElectric_km",
         )
 
-    @property
-    def battery_cruising_range_last_updated(self) -> datetime | None:
-        """Return battery cruising range last updated."""
-        return find_path(
-            self.attrs, f"{Services.CHARGING}.batteryStatus.value.carCapturedTimestamp"
-        )
+    battery_cruising_range_last_updated = battery_level_last_updated
 
-    @property
+    @_cached_by_state
     def is_battery_cruising_range_supported(self) -> bool:
         """Return true if battery cruising range is supported.
 
@@ -1872,67 +1959,37 @@ class Vehicle:
 
         :return:
         """
-        fuel_level_pct = ""
+        # The measurements value takes precedence over the fuel status one
+        if is_valid_path(self.attrs, _FUEL_LEVEL_PATH):
+            return find_path(self.attrs, _FUEL_LEVEL_PATH)
         if (
-            is_valid_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.currentFuelLevel_pct",
-            )
+            is_valid_path(self.attrs, _FUEL_STATUS_PRIMARY_FUEL_LEVEL_PATH)
             and not self.is_primary_drive_gas()
         ):
-            fuel_level_pct = find_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.currentFuelLevel_pct",
-            )
-
-        if is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentFuelLevel_pct",
-        ):
-            fuel_level_pct = find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentFuelLevel_pct",
-            )
-        return fuel_level_pct
+            return find_path(self.attrs, _FUEL_STATUS_PRIMARY_FUEL_LEVEL_PATH)
+        return ""
 
     @property
     def fuel_level_last_updated(self) -> datetime:
         """Return fuel level last updated."""
-        fuel_level_lastupdated = ""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp"
-        ):
-            fuel_level_lastupdated = find_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp",
-            )
-
-        if is_valid_path(
+        # The measurements timestamp takes precedence over the fuel status one
+        return find_first_path(
             self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carCapturedTimestamp",
-        ):
-            fuel_level_lastupdated = find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carCapturedTimestamp",
-            )
-        return fuel_level_lastupdated
+            _FUEL_LEVEL_TIMESTAMP_PATH,
+            _FUEL_STATUS_TIMESTAMP_PATH,
+            default="",
+        )
 
-    @property
+    @_cached_by_state
     def is_fuel_level_supported(self) -> bool:
         """Return true if fuel level reporting is supported.
 
         :return:
         """
         return (
-            is_valid_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.currentFuelLevel_pct",
-            )
+            is_valid_path(self.attrs, _FUEL_STATUS_PRIMARY_FUEL_LEVEL_PATH)
             and not self.is_primary_drive_gas()
-        ) or is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentFuelLevel_pct",
-        )
+        ) or is_valid_path(self.attrs, _FUEL_LEVEL_PATH)
 
     @property
     def gas_level(self) -> int:
@@ -1942,69 +1999,37 @@ class Vehicle:
         """
         gas_level_pct = ""
         if (
-            is_valid_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.currentFuelLevel_pct",
-            )
+            is_valid_path(self.attrs, _FUEL_STATUS_PRIMARY_FUEL_LEVEL_PATH)
             and self.is_primary_drive_gas()
         ):
-            gas_level_pct = find_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.currentFuelLevel_pct",
-            )
+            gas_level_pct = find_path(self.attrs, _FUEL_STATUS_PRIMARY_FUEL_LEVEL_PATH)
 
-        if is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentCngLevel_pct",
-        ):
-            gas_level_pct = find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentCngLevel_pct",
-            )
+        if is_valid_path(self.attrs, _CNG_LEVEL_PATH):
+            gas_level_pct = find_path(self.attrs, _CNG_LEVEL_PATH)
         return gas_level_pct
 
     @property
     def gas_level_last_updated(self) -> datetime:
         """Return gas level last updated."""
-        gas_level_lastupdated = ""
-        if (
-            is_valid_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp",
-            )
-            and self.is_primary_drive_gas()
-        ):
-            gas_level_lastupdated = find_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp",
-            )
-
-        if is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carCapturedTimestamp",
-        ):
-            gas_level_lastupdated = find_path(
+        if self.is_primary_drive_gas():
+            return find_first_path(
                 self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carCapturedTimestamp",
+                _FUEL_LEVEL_TIMESTAMP_PATH,
+                _FUEL_STATUS_TIMESTAMP_PATH,
+                default="",
             )
-        return gas_level_lastupdated
+        return find_path(self.attrs, _FUEL_LEVEL_TIMESTAMP_PATH, default="")
 
-    @property
+    @_cached_by_state
     def is_gas_level_supported(self) -> bool:
         """Return true if gas level reporting is supported.
 
         :return:
         """
         return (
-            is_valid_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.currentFuelLevel_pct",
-            )
+            is_valid_path(self.attrs, _FUEL_STATUS_PRIMARY_FUEL_LEVEL_PATH)
             and self.is_primary_drive_gas()
-        ) or is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.currentCngLevel_pct",
-        )
+        ) or is_valid_path(self.attrs, _CNG_LEVEL_PATH)
 
     @property
     def car_type(self) -> str:
@@ -2012,54 +2037,28 @@ class Vehicle:
 
         :return:
         """
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-        ):
-            return find_path(
-                self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-            ).capitalize()
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-        ):
-            return find_path(
-                self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-            ).capitalize()
-        return "Unknown"
+        car_type = self._car_type
+        return "Unknown" if car_type is None else car_type.capitalize()
 
     @property
     def car_type_last_updated(self) -> datetime | None:
         """Return car type last updated."""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp"
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.carCapturedTimestamp",
-            )
-        if is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carCapturedTimestamp",
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carCapturedTimestamp",
-            )
-        return None
+        return find_first_path(
+            self.attrs, _FUEL_STATUS_TIMESTAMP_PATH, _FUEL_LEVEL_TIMESTAMP_PATH
+        )
 
-    @property
+    @_cached_by_state
     def is_car_type_supported(self) -> bool:
         """Return true if car type is supported.
 
         :return:
         """
-        return is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-        ) or is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
+        return is_valid_path(self.attrs, _FUEL_STATUS_CAR_TYPE_PATH) or is_valid_path(
+            self.attrs, _FUEL_LEVEL_CAR_TYPE_PATH
         )
 
     # Climatisation settings
-    @property
+    @_cached_by_state
     def climatisation_target_temperature(self) -> float | None:
         """Return the target temperature from climater."""
         # TODO should we handle Fahrenheit?? # pylint: disable=fixme
@@ -2070,15 +2069,12 @@ class Vehicle:
             )
         )
 
-    @property
+    @_cached_by_state
     def climatisation_target_temperature_last_updated(self) -> datetime:
         """Return the target temperature from climater last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp",
-        )
+        return find_path(self.attrs, _CLIMATISATION_SETTINGS_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_climatisation_target_temperature_supported(self) -> bool:
         """Return true if climatisation target temperature is supported."""
         return is_valid_path(
@@ -2094,15 +2090,11 @@ class Vehicle:
             f"{Services.CLIMATISATION}.climatisationSettings.value.climatisationWithoutExternalPower",
         )
 
-    @property
-    def climatisation_without_external_power_last_updated(self) -> datetime:
-        """Return state of climatisation from battery power last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp",
-        )
+    climatisation_without_external_power_last_updated = (
+        climatisation_target_temperature_last_updated
+    )
 
-    @property
+    @_cached_by_state
     def is_climatisation_without_external_power_supported(self) -> bool:
         """Return true if climatisation on battery power is supported."""
         return is_valid_path(
@@ -2118,15 +2110,11 @@ class Vehicle:
             f"{Services.CLIMATISATION}.climatisationSettings.value.climatizationAtUnlock",
         )
 
-    @property
-    def auxiliary_air_conditioning_last_updated(self) -> datetime:
-        """Return state of auxiliary air conditioning last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp",
-        )
+    auxiliary_air_conditioning_last_updated = (
+        climatisation_target_temperature_last_updated
+    )
 
-    @property
+    @_cached_by_state
     def is_auxiliary_air_conditioning_supported(self) -> bool:
         """Return true if auxiliary air conditioning is supported."""
         return is_valid_path(
@@ -2142,15 +2130,11 @@ class Vehicle:
             f"{Services.CLIMATISATION}.climatisationSettings.value.windowHeatingEnabled",
         )
 
-    @property
-    def automatic_window_heating_last_updated(self) -> datetime:
-        """Return state of automatic window heating last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp",
-        )
+    automatic_window_heating_last_updated = (
+        climatisation_target_temperature_last_updated
+    )
 
-    @property
+    @_cached_by_state
     def is_automatic_window_heating_supported(self) -> bool:
         """Return true if automatic window heating is supported."""
         return is_valid_path(
@@ -2166,15 +2150,9 @@ class Vehicle:
             f"{Services.CLIMATISATION}.climatisationSettings.value.zoneFrontLeftEnabled",
         )
 
-    @property
-    def zone_front_left_last_updated(self) -> datetime:
-        """Return state of zone front left last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp",
-        )
+    zone_front_left_last_updated = climatisation_target_temperature_last_updated
 
-    @property
+    @_cached_by_state
     def is_zone_front_left_supported(self) -> bool:
         """Return true if zone front left is supported."""
         return is_valid_path(
@@ -2190,15 +2168,9 @@ class Vehicle:
             f"{Services.CLIMATISATION}.climatisationSettings.value.zoneFrontRightEnabled",
         )
 
-    @property
-    def zone_front_right_last_updated(self) -> datetime:
-        """Return state of zone front left last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp",
-        )
+    zone_front_right_last_updated = climatisation_target_temperature_last_updated
 
-    @property
+    @_cached_by_state
     def is_zone_front_right_supported(self) -> bool:
         """Return true if zone front left is supported."""
         return is_valid_path(
@@ -2210,31 +2182,24 @@ class Vehicle:
     @property
     def electric_climatisation(self) -> bool:
         """Return status of climatisation."""
-        status = find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationStatus.value.climatisationState",
-        )
-        return status in ["ventilation", "heating", "cooling", "on"]
+        status = find_path(self.attrs, _CLIMATISATION_STATE_PATH)
+        return status in ELECTRIC_CLIMATISATION_STATES
 
-    @property
+    @_cached_by_state
     def electric_climatisation_last_updated(self) -> datetime:
         """Return status of climatisation last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationStatus.value.carCapturedTimestamp",
-        )
+        return find_path(self.attrs, _CLIMATISATION_STATUS_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_electric_climatisation_supported(self) -> bool:
         """Return true if vehicle has climater."""
         return (
             self.is_climatisation_supported
             and self.is_climatisation_target_temperature_supported
-            and self.is_climatisation_without_external_power_supported
-        ) or (
-            self.is_car_type_electric
-            and self.is_climatisation_supported
-            and self.is_climatisation_target_temperature_supported
+            and (
+                self.is_climatisation_without_external_power_supported
+                or self.is_car_type_electric
+            )
         )
 
     @property
@@ -2245,15 +2210,11 @@ class Vehicle:
             f"{Services.CLIMATISATION}.climatisationStatus.value.remainingClimatisationTime_min",
         )
 
-    @property
-    def electric_remaining_climatisation_time_last_updated(self) -> bool:
-        """Return status of electric climatisation remaining climatisation time last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationStatus.value.carCapturedTimestamp",
-        )
+    electric_remaining_climatisation_time_last_updated = (
+        electric_climatisation_last_updated
+    )
 
-    @property
+    @_cached_by_state
     def is_electric_remaining_climatisation_time_supported(self) -> bool:
         """Return true if electric climatisation remaining climatisation time is supported."""
         return is_valid_path(
@@ -2264,538 +2225,240 @@ class Vehicle:
     @property
     def auxiliary_climatisation(self) -> bool:
         """Return status of auxiliary climatisation."""
-        climatisation_state = None
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.climatisationState",
-        ):
-            climatisation_state = find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.climatisationState",
-            )
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationStatus.value.climatisationState",
-        ):
-            climatisation_state = find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION}.climatisationStatus.value.climatisationState",
-            )
-        if climatisation_state in ["heating", "heatingAuxiliary", "on"]:
+        climatisation_state = find_path(
+            self.attrs, _AUXILIARY_HEATING_STATE_PATH, default=None
+        )
+        climatisation_state = find_path(
+            self.attrs, _CLIMATISATION_STATE_PATH, default=climatisation_state
+        )
+        if climatisation_state in AUXILIARY_CLIMATISATION_STATES:
             return True
         return False
 
-    @property
+    @_cached_by_state
     def auxiliary_climatisation_last_updated(self) -> datetime:
         """Return status of auxiliary climatisation last updated."""
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.carCapturedTimestamp",
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.carCapturedTimestamp",
-            )
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationStatus.value.carCapturedTimestamp",
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION}.climatisationStatus.value.carCapturedTimestamp",
+        timestamp = find_path(
+            self.attrs, _AUXILIARY_HEATING_TIMESTAMP_PATH, default=None
+        )
+        if timestamp is None:
+            timestamp = find_path(
+                self.attrs, _CLIMATISATION_STATUS_TIMESTAMP_PATH, default=None
             )
-        return None
+        return timestamp
 
-    @property
+    @_cached_by_state
     def is_auxiliary_climatisation_supported(self) -> bool:
         """Return true if vehicle has auxiliary climatisation."""
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.climatisationState",
-        ):
+        if is_valid_path(self.attrs, _AUXILIARY_HEATING_STATE_PATH):
             return True
-        if is_valid_path(
-            self.attrs, f"{Services.USER_CAPABILITIES}.capabilitiesStatus.value"
-        ):
-            capabilities = find_path(
-                self.attrs, f"{Services.USER_CAPABILITIES}.capabilitiesStatus.value"
-            )
-            for capability in capabilities:
-                if capability.get("id", None) == "hybridCarAuxiliaryHeating":
-                    if 1007 in capability.get("status", []):
-                        return False
-                    return True
+        for capability in find_path(self.attrs, _USER_CAPABILITIES_PATH, default=()):
+            if capability.get("id", None) == "hybridCarAuxiliaryHeating":
+                if 1007 in capability.get("status", []):
+                    return False
+                return True
         return False
 
     @property
     def auxiliary_duration(self) -> int:
         """Return heating duration for auxiliary heater."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.auxiliaryHeatingSettings.duration_min",
-        )
+        return find_path(self.attrs, _AUXILIARY_HEATING_DURATION_PATH)
 
-    @property
-    def auxiliary_duration_last_updated(self) -> bool:
-        """Return status of auxiliary heater last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.carCapturedTimestamp",
-        )
+    auxiliary_duration_last_updated = climatisation_target_temperature_last_updated
 
-    @property
+    @_cached_by_state
     def is_auxiliary_duration_supported(self) -> bool:
         """Return true if auxiliary heater is supported."""
-        return is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationSettings.value.auxiliaryHeatingSettings.duration_min",
-        )
+        return is_valid_path(self.attrs, _AUXILIARY_HEATING_DURATION_PATH)
 
     @property
     def auxiliary_remaining_climatisation_time(self) -> int:
         """Return remaining climatisation time for auxiliary heater."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.remainingClimatisationTime_min",
-        )
+        return find_path(self.attrs, _AUXILIARY_HEATING_REMAINING_TIME_PATH)
 
-    @property
-    def auxiliary_remaining_climatisation_time_last_updated(self) -> bool:
+    @_cached_by_state
+    def auxiliary_remaining_climatisation_time_last_updated(self) -> datetime:
         """Return status of auxiliary heater remaining climatisation time last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.carCapturedTimestamp",
-        )
+        return find_path(self.attrs, _AUXILIARY_HEATING_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_auxiliary_remaining_climatisation_time_supported(self) -> bool:
         """Return true if auxiliary heater remaining climatisation time is supported."""
-        return is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.auxiliaryHeatingStatus.value.remainingClimatisationTime_min",
-        )
+        return is_valid_path(self.attrs, _AUXILIARY_HEATING_REMAINING_TIME_PATH)
 
-    @property
+    @_cached_by_state
     def is_climatisation_supported(self) -> bool:
         """Return true if climatisation has State."""
-        return is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationStatus.value.climatisationState",
-        )
+        return is_valid_path(self.attrs, _CLIMATISATION_STATE_PATH)
 
-    @property
-    def is_climatisation_supported_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.climatisationStatus.value.carCapturedTimestamp",
-        )
+    is_climatisation_supported_last_updated = electric_climatisation_last_updated
+
+    @_cached_by_state
+    def _window_heaters_on(self) -> dict[str, bool]:
+        """Return whether window heaters are on by window location."""
+        heaters: dict[str, bool] = {}
+        for window_heating_state in find_path(
+            self.attrs, _WINDOW_HEATING_STATUS_PATH, default=()
+        ):
+            heaters.setdefault(
+                window_heating_state["windowLocation"],
+                window_heating_state["windowHeatingState"] == "on",
+            )
+        return heaters
 
     @property
     def window_heater_front(self) -> bool:
         """Return status of front window heater."""
-        window_heating_status = find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.windowHeatingStatus.value.windowHeatingStatus",
-        )
-        for window_heating_state in window_heating_status:
-            if window_heating_state["windowLocation"] == "front":
-                return window_heating_state["windowHeatingState"] == "on"
-
-        return False
+        return self._window_heaters_on.get("front", False)
 
-    @property
+    @_cached_by_state
     def window_heater_front_last_updated(self) -> datetime:
         """Return front window heater last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.windowHeatingStatus.value.carCapturedTimestamp",
-        )
+        return find_path(self.attrs, _WINDOW_HEATING_TIMESTAMP_PATH)
 
-    @property
+    @_cached_by_state
     def is_window_heater_front_supported(self) -> bool:
         """Return true if vehicle has heater."""
-        return is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.windowHeatingStatus.value.windowHeatingStatus",
-        )
+        return is_valid_path(self.attrs, _WINDOW_HEATING_STATUS_PATH)
 
     @property
     def window_heater_back(self) -> bool:
         """Return status of rear window heater."""
-        window_heating_status = find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.windowHeatingStatus.value.windowHeatingStatus",
-        )
-        for window_heating_state in window_heating_status:
-            if window_heating_state["windowLocation"] == "rear":
-                return window_heating_state["windowHeatingState"] == "on"
+        return self._window_heaters_on.get("rear", False)
 
-        return False
+    window_heater_back_last_updated = window_heater_front_last_updated
 
-    @property
-    def window_heater_back_last_updated(self) -> datetime:
-        """Return front window heater last updated."""
-        return find_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.windowHeatingStatus.value.carCapturedTimestamp",
-        )
-
-    @property
+    @_cached_by_state
     def is_window_heater_back_supported(self) -> bool:
         """Return true if vehicle has heater."""
-        return is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION}.windowHeatingStatus.value.windowHeatingStatus",
-        )
+        return is_valid_path(self.attrs, _WINDOW_HEATING_STATUS_PATH)
 
     @property
     def window_heater(self) -> bool:
         """Return status of window heater."""
         return self.window_heater_front or self.window_heater_back
 
-    @property
-    def window_heater_last_updated(self) -> datetime:
-        """Return front window heater last updated."""
-        return self.window_heater_front_last_updated
+    window_heater_last_updated = window_heater_front_last_updated
 
     @property
     def is_window_heater_supported(self) -> bool:
         """Return true if vehicle has heater."""
-        # ID models detection
-        if (
-            self._services.get(Services.PARAMETERS, {}).get(
-                "supportsStartWindowHeating", "false"
-            )
-            == "true"
-        ):
-            return True
-        # "Legacy" models detection
-        parameters = self._services.get(Services.CLIMATISATION, {}).get(
-            "parameters", None
-        )
-        if parameters:
-            for parameter in parameters:
-                if (
-                    parameter["key"] == "supportsStartWindowHeating"
-                    and parameter["value"] == "true"
-                ):
-                    return True
-        return False
+        return self._supports_start_window_heating
 
     # Windows
-    @property
-    def windows_closed(self) -> bool:
+    @_cached_by_state
+    def _windows_by_name(self) -> dict[str, frozenset[str]]:
+        """Return status of windows by name."""
+        return _status_by_name(find_path(self.attrs, _ACCESS_WINDOWS_PATH, default=()))
+
+    def _window_closed(self, name: str) -> bool | None:
+        """Return closed state of window, or None if its status is unknown."""
+        status = self._windows_by_name.get(name)
+        if status is None:
+            return False
+        if status.isdisjoint(P.VALID_WINDOW_STATUS):
+            return None
+        return "closed" in status
+
+    def _is_window_supported(self, name: str) -> bool:
+        """Return true if window state is supported."""
+        status = self._windows_by_name.get(name)
+        return status is not None and "unsupported" not in status
+
+    @_cached_by_state
+    def windows_closed(self) -> bool | None:
         """Return true if all supported windows are closed.
 
         :return:
         """
-        return (
-            (
-                not self.is_window_closed_left_front_supported
-                or self.window_closed_left_front
-            )
-            and (
-                not self.is_window_closed_left_back_supported
-                or self.window_closed_left_back
-            )
-            and (
-                not self.is_window_closed_right_front_supported
-                or self.window_closed_right_front
-            )
-            and (
-                not self.is_window_closed_right_back_supported
-                or self.window_closed_right_back
-            )
-        )
+        for name in _SIDE_WINDOWS:
+            if self._is_window_supported(name):
+                closed = self._window_closed(name)
+                # Unknown states are passed on as None instead of False
+                if not closed:
+                    return closed
+        return True
 
     @property
     def windows_closed_last_updated(self) -> datetime:
         """Return timestamp for windows state last updated."""
         return self.window_closed_left_front_last_updated
 
-    @property
+    @_cached_by_state
     def is_windows_closed_supported(self) -> bool:
         """Return true if window state is supported."""
-        return (
-            self.is_window_closed_left_front_supported
-            or self.is_window_closed_left_back_supported
-            or self.is_window_closed_right_front_supported
-            or self.is_window_closed_right_back_supported
-        )
-
-    @property
-    def window_closed_left_front(self) -> bool:
-        """Return left front window closed state.
+        return any(self._is_window_supported(name) for name in _SIDE_WINDOWS)
 
-        :return:
-        """
-        windows = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows")
-        for window in windows:
-            if window["name"] == "frontLeft":
-                if not any(
-                    valid_status in window["status"]
-                    for valid_status in P.VALID_WINDOW_STATUS
-                ):
-                    return None
-                return "closed" in window["status"]
-        return False
+    window_closed_left_front = _named_property(
+        _window_closed, "frontLeft", "Return left front window closed state."
+    )
 
-    @property
+    @_cached_by_state
     def window_closed_left_front_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+        return find_path(self.attrs, _ACCESS_TIMESTAMP_PATH)
 
-    @property
-    def is_window_closed_left_front_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"):
-            windows = find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"
-            )
-            for window in windows:
-                if (
-                    window["name"] == "frontLeft"
-                    and "unsupported" not in window["status"]
-                ):
-                    return True
-        return False
+    is_window_closed_left_front_supported = _supported_property(
+        _is_window_supported, "frontLeft"
+    )
 
-    @property
-    def window_closed_right_front(self) -> bool:
-        """Return right front window closed state.
+    window_closed_right_front = _named_property(
+        _window_closed, "frontRight", "Return right front window closed state."
+    )
 
-        :return:
-        """
-        windows = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows")
-        for window in windows:
-            if window["name"] == "frontRight":
-                if not any(
-                    valid_status in window["status"]
-                    for valid_status in P.VALID_WINDOW_STATUS
-                ):
-                    return None
-                return "closed" in window["status"]
-        return False
+    window_closed_right_front_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def window_closed_right_front_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    is_window_closed_right_front_supported = _supported_property(
+        _is_window_supported, "frontRight"
+    )
 
-    @property
-    def is_window_closed_right_front_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"):
-            windows = find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"
-            )
-            for window in windows:
-                if (
-                    window["name"] == "frontRight"
-                    and "unsupported" not in window["status"]
-                ):
-                    return True
-        return False
+    window_closed_left_back = _named_property(
+        _window_closed, "rearLeft", "Return left back window closed state."
+    )
 
-    @property
-    def window_closed_left_back(self) -> bool:
-        """Return left back window closed state.
+    window_closed_left_back_last_updated = window_closed_left_front_last_updated
 
-        :return:
-        """
-        windows = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows")
-        for window in windows:
-            if window["name"] == "rearLeft":
-                if not any(
-                    valid_status in window["status"]
-                    for valid_status in P.VALID_WINDOW_STATUS
-                ):
-                    return None
-                return "closed" in window["status"]
-        return False
+    is_window_closed_left_back_supported = _supported_property(
+        _is_window_supported, "rearLeft"
+    )
 
-    @property
-    def window_closed_left_back_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    window_closed_right_back = _named_property(
+        _window_closed, "rearRight", "Return right back window closed state."
+    )
 
-    @property
-    def is_window_closed_left_back_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"):
-            windows = find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"
-            )
-            for window in windows:
-                if (
-                    window["name"] == "rearLeft"
-                    and "unsupported" not in window["status"]
-                ):
-                    return True
-        return False
+    window_closed_right_back_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def window_closed_right_back(self) -> bool:
-        """Return right back window closed state.
+    is_window_closed_right_back_supported = _supported_property(
+        _is_window_supported, "rearRight"
+    )
 
-        :return:
-        """
-        windows = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows")
-        for window in windows:
-            if window["name"] == "rearRight":
-                if not any(
-                    valid_status in window["status"]
-                    for valid_status in P.VALID_WINDOW_STATUS
-                ):
-                    return None
-                return "closed" in window["status"]
-        return False
+    sunroof_closed = _named_property(
+        _window_closed, "sunRoof", "Return sunroof closed state."
+    )
 
-    @property
-    def window_closed_right_back_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    sunroof_closed_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def is_window_closed_right_back_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"):
-            windows = find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"
-            )
-            for window in windows:
-                if (
-                    window["name"] == "rearRight"
-                    and "unsupported" not in window["status"]
-                ):
-                    return True
-        return False
+    is_sunroof_closed_supported = _supported_property(_is_window_supported, "sunRoof")
 
-    @property
-    def sunroof_closed(self) -> bool:
-        """Return sunroof closed state.
+    sunroof_rear_closed = _named_property(
+        _window_closed, "sunRoofRear", "Return sunroof rear closed state."
+    )
 
-        :return:
-        """
-        windows = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows")
-        for window in windows:
-            if window["name"] == "sunRoof":
-                if not any(
-                    valid_status in window["status"]
-                    for valid_status in P.VALID_WINDOW_STATUS
-                ):
-                    return None
-                return "closed" in window["status"]
-        return False
+    sunroof_rear_closed_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def sunroof_closed_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    is_sunroof_rear_closed_supported = _supported_property(
+        _is_window_supported, "sunRoofRear"
+    )
 
-    @property
-    def is_sunroof_closed_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"):
-            windows = find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"
-            )
-            for window in windows:
-                if (
-                    window["name"] == "sunRoof"
-                    and "unsupported" not in window["status"]
-                ):
-                    return True
-        return False
+    roof_cover_closed = _named_property(
+        _window_closed, "roofCover", "Return roof cover closed state."
+    )
 
-    @property
-    def sunroof_rear_closed(self) -> bool:
-        """Return sunroof rear closed state.
+    roof_cover_closed_last_updated = window_closed_left_front_last_updated
 
-        :return:
-        """
-        windows = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows")
-        for window in windows:
-            if window["name"] == "sunRoofRear":
-                if not any(
-                    valid_status in window["status"]
-                    for valid_status in P.VALID_WINDOW_STATUS
-                ):
-                    return None
-                return "closed" in window["status"]
-        return False
-
-    @property
-    def sunroof_rear_closed_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
-
-    @property
-    def is_sunroof_rear_closed_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"):
-            windows = find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"
-            )
-            for window in windows:
-                if (
-                    window["name"] == "sunRoofRear"
-                    and "unsupported" not in window["status"]
-                ):
-                    return True
-        return False
-
-    @property
-    def roof_cover_closed(self) -> bool:
-        """Return roof cover closed state.
-
-        :return:
-        """
-        windows = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.windows")
-        for window in windows:
-            if window["name"] == "roofCover":
-                if not any(
-                    valid_status in window["status"]
-                    for valid_status in P.VALID_WINDOW_STATUS
-                ):
-                    return None
-                return "closed" in window["status"]
-        return False
-
-    @property
-    def roof_cover_closed_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
-
-    @property
-    def is_roof_cover_closed_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            windows = find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.windows"
-            )
-            for window in windows:
-                if (
-                    window["name"] == "roofCover"
-                    and "unsupported" not in window["status"]
-                ):
-                    return True
-        return False
+    is_roof_cover_closed_supported = _supported_property(
+        _is_window_supported, "roofCover"
+    )
 
     # Locks
     @property
@@ -2809,26 +2472,11 @@ class Vehicle:
 
         :return:
         """
-        return (
-            find_path(
-                self.attrs, f"{Services.ACCESS}.accessStatus.value.doorLockStatus"
-            )
-            == "locked"
-        )
+        return find_path(self.attrs, _DOOR_LOCK_STATUS_PATH) == "locked"
 
-    @property
-    def door_locked_last_updated(self) -> datetime:
-        """Return door lock last updated."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    door_locked_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def door_locked_sensor_last_updated(self) -> datetime:
-        """Return door lock last updated."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    door_locked_sensor_last_updated = window_closed_left_front_last_updated
 
     @property
     def is_door_locked_supported(self) -> bool:
@@ -2837,11 +2485,9 @@ class Vehicle:
         :return:
         """
         # First check that the service is actually enabled
-        if not self._services.get(Services.ACCESS, {}).get("active", False):
+        if not self._services[Services.ACCESS]["active"]:
             return False
-        return is_valid_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.doorLockStatus"
-        )
+        return is_valid_path(self.attrs, _DOOR_LOCK_STATUS_PATH)
 
     @property
     def is_door_locked_sensor_supported(self) -> bool:
@@ -2850,11 +2496,9 @@ class Vehicle:
         :return:
         """
         # Use real lock if the service is actually enabled
-        if self._services.get(Services.ACCESS, {}).get("active", False):
+        if self._services[Services.ACCESS]["active"]:
             return False
-        return is_valid_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.doorLockStatus"
-        )
+        return is_valid_path(self.attrs, _DOOR_LOCK_STATUS_PATH)
 
     @property
     def trunk_locked(self) -> bool:
@@ -2862,18 +2506,9 @@ class Vehicle:
 
         :return:
         """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "trunk":
-                return "locked" in door["status"]
-        return False
+        return "locked" in self._doors_by_name.get("trunk", ())
 
-    @property
-    def trunk_locked_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    trunk_locked_last_updated = window_closed_left_front_last_updated
 
     @property
     def is_trunk_locked_supported(self) -> bool:
@@ -2881,14 +2516,9 @@ class Vehicle:
 
         :return:
         """
-        if not self._services.get(Services.ACCESS, {}).get("active", False):
+        if not self._services[Services.ACCESS]["active"]:
             return False
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "trunk" and "unsupported" not in door["status"]:
-                    return True
-        return False
+        return self._is_door_supported("trunk")
 
     @property
     def trunk_locked_sensor(self) -> bool:
@@ -2896,18 +2526,9 @@ class Vehicle:
 
         :return:
         """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "trunk":
-                return "locked" in door["status"]
-        return False
+        return "locked" in self._doors_by_name.get("trunk", ())
 
-    @property
-    def trunk_locked_sensor_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    trunk_locked_sensor_last_updated = window_closed_left_front_last_updated
 
     @property
     def is_trunk_locked_sensor_supported(self) -> bool:
@@ -2915,185 +2536,75 @@ class Vehicle:
 
         :return:
         """
-        if self._services.get(Services.ACCESS, {}).get("active", False):
+        if self._services[Services.ACCESS]["active"]:
             return False
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "trunk" and "unsupported" not in door["status"]:
-                    return True
-        return False
+        return self._is_door_supported("trunk")
 
     # Doors, hood and trunk
-    @property
-    def hood_closed(self) -> bool:
-        """Return hood closed state.
-
-        :return:
-        """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "bonnet":
-                if not any(
-                    valid_status in door["status"]
-                    for valid_status in P.VALID_DOOR_STATUS
-                ):
-                    return None
-                return "closed" in door["status"]
-        return False
-
-    @property
-    def hood_closed_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    @_cached_by_state
+    def _doors_by_name(self) -> dict[str, frozenset[str]]:
+        """Return status of doors by name."""
+        return _status_by_name(find_path(self.attrs, _ACCESS_DOORS_PATH, default=()))
+
+    def _door_closed(self, name: str) -> bool | None:
+        """Return closed state of door, or None if its status is unknown."""
+        status = self._doors_by_name.get(name)
+        if status is None:
+            return False
+        if status.isdisjoint(P.VALID_DOOR_STATUS):
+            return None
+        return "closed" in status
 
-    @property
-    def is_hood_closed_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "bonnet" and "unsupported" not in door["status"]:
-                    return True
-        return False
+    def _is_door_supported(self, name: str) -> bool:
+        """Return true if door state is supported."""
+        status = self._doors_by_name.get(name)
+        return status is not None and "unsupported" not in status
 
-    @property
-    def door_closed_left_front(self) -> bool:
-        """Return left front door closed state.
+    hood_closed = _named_property(_door_closed, "bonnet", "Return hood closed state.")
 
-        :return:
-        """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "frontLeft":
-                if not any(
-                    valid_status in door["status"]
-                    for valid_status in P.VALID_DOOR_STATUS
-                ):
-                    return None
-                return "closed" in door["status"]
-        return False
+    hood_closed_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def door_closed_left_front_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    is_hood_closed_supported = _supported_property(_is_door_supported, "bonnet")
 
-    @property
-    def is_door_closed_left_front_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "frontLeft" and "unsupported" not in door["status"]:
-                    return True
-        return False
+    door_closed_left_front = _named_property(
+        _door_closed, "frontLeft", "Return left front door closed state."
+    )
 
-    @property
-    def door_closed_right_front(self) -> bool:
-        """Return right front door closed state.
+    door_closed_left_front_last_updated = window_closed_left_front_last_updated
 
-        :return:
-        """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "frontRight":
-                if not any(
-                    valid_status in door["status"]
-                    for valid_status in P.VALID_DOOR_STATUS
-                ):
-                    return None
-                return "closed" in door["status"]
-        return False
+    is_door_closed_left_front_supported = _supported_property(
+        _is_door_supported, "frontLeft"
+    )
 
-    @property
-    def door_closed_right_front_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    door_closed_right_front = _named_property(
+        _door_closed, "frontRight", "Return right front door closed state."
+    )
 
-    @property
-    def is_door_closed_right_front_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "frontRight" and "unsupported" not in door["status"]:
-                    return True
-        return False
+    door_closed_right_front_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def door_closed_left_back(self) -> bool:
-        """Return left back door closed state.
+    is_door_closed_right_front_supported = _supported_property(
+        _is_door_supported, "frontRight"
+    )
 
-        :return:
-        """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "rearLeft":
-                if not any(
-                    valid_status in door["status"]
-                    for valid_status in P.VALID_DOOR_STATUS
-                ):
-                    return None
-                return "closed" in door["status"]
-        return False
+    door_closed_left_back = _named_property(
+        _door_closed, "rearLeft", "Return left back door closed state."
+    )
 
-    @property
-    def door_closed_left_back_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
-
-    @property
-    def is_door_closed_left_back_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "rearLeft" and "unsupported" not in door["status"]:
-                    return True
-        return False
+    door_closed_left_back_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def door_closed_right_back(self) -> bool:
-        """Return right back door closed state.
+    is_door_closed_left_back_supported = _supported_property(
+        _is_door_supported, "rearLeft"
+    )
 
-        :return:
-        """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "rearRight":
-                if not any(
-                    valid_status in door["status"]
-                    for valid_status in P.VALID_DOOR_STATUS
-                ):
-                    return None
-                return "closed" in door["status"]
-        return False
+    door_closed_right_back = _named_property(
+        _door_closed, "rearRight", "Return right back door closed state."
+    )
 
-    @property
-    def door_closed_right_back_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    door_closed_right_back_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def is_door_closed_right_back_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "rearRight" and "unsupported" not in door["status"]:
-                    return True
-        return False
+    is_door_closed_right_back_supported = _supported_property(
+        _is_door_supported, "rearRight"
+    )
 
     @property
     def trunk_closed(self) -> bool:
@@ -3101,28 +2612,11 @@ class Vehicle:
 
         :return:
         """
-        doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-        for door in doors:
-            if door["name"] == "trunk":
-                return "closed" in door["status"]
-        return False
+        return "closed" in self._doors_by_name.get("trunk", ())
 
-    @property
-    def trunk_closed_last_updated(self) -> datetime:
-        """Return attribute last updated timestamp."""
-        return find_path(
-            self.attrs, f"{Services.ACCESS}.accessStatus.value.carCapturedTimestamp"
-        )
+    trunk_closed_last_updated = window_closed_left_front_last_updated
 
-    @property
-    def is_trunk_closed_supported(self) -> bool:
-        """Return true if supported."""
-        if is_valid_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors"):
-            doors = find_path(self.attrs, f"{Services.ACCESS}.accessStatus.value.doors")
-            for door in doors:
-                if door["name"] == "trunk" and "unsupported" not in door["status"]:
-                    return True
-        return False
+    is_trunk_closed_supported = _supported_property(_is_door_supported, "trunk")
 
     # Departure timers
     @property
@@ -3140,56 +2634,34 @@ class Vehicle:
         """Return timer #3 status."""
         return self.departure_timer_enabled(3)
 
-    @property
+    @_cached_by_state
     def departure_timer1_last_updated(self) -> datetime:
         """Return last updated timestamp."""
-        if is_valid_path(
-            self.attrs,
-            f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.carCapturedTimestamp",
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.carCapturedTimestamp",
-            )
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.carCapturedTimestamp",
-        ):
-            return find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.carCapturedTimestamp",
-            )
-        if is_valid_path(
-            self.attrs,
-            f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.carCapturedTimestamp",
+        for path in (
+            _DEPARTURE_PROFILES_TIMESTAMP_PATH,
+            _AUXILIARY_HEATING_TIMERS_TIMESTAMP_PATH,
+            _DEPARTURE_TIMERS_TIMESTAMP_PATH,
         ):
-            return find_path(
-                self.attrs,
-                f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.carCapturedTimestamp",
-            )
+            timestamp = find_path(self.attrs, path, default=None)
+            if timestamp is not None:
+                return timestamp
         return None
 
-    @property
-    def departure_timer2_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return self.departure_timer1_last_updated
+    departure_timer2_last_updated = departure_timer1_last_updated
 
-    @property
-    def departure_timer3_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return self.departure_timer1_last_updated
+    departure_timer3_last_updated = departure_timer1_last_updated
 
-    @property
+    @_cached_by_state
     def is_departure_timer1_supported(self) -> bool:
         """Check if timer 1 is supported."""
         return self.is_departure_timer_supported(1)
 
-    @property
+    @_cached_by_state
     def is_departure_timer2_supported(self) -> bool:
         """Check if timer 2is supported."""
         return self.is_departure_timer_supported(2)
 
-    @property
+    @_cached_by_state
     def is_departure_timer3_supported(self) -> bool:
         """Check if timer 3 is supported."""
         return self.is_departure_timer_supported(3)
@@ -3215,10 +2687,8 @@ class Vehicle:
                 start_date_time = timer.get("singleTimer", None).get(
                     "startDateTime", None
                 )
-                start_time = (
-                    start_date_time.replace(tzinfo=UTC)
-                    .astimezone(tz=None)
-                    .strftime("%Y-%m-%dT%H:%M:%S")
+                start_time = start_date_time.astimezone(tz=None).strftime(
+                    "%Y-%m-%dT%H:%M:%S"
                 )
             if timer.get("singleTimer", None).get("startDateTimeLocal", None):
                 start_date_time = timer.get("singleTimer", None).get(
@@ -3294,56 +2764,28 @@ class Vehicle:
             )
         return data
 
+    @_cached_by_state
+    def _departure_timers_by_id(self) -> dict:
+        """Return departure timers by id, preferring departure profile timers."""
+        timers = {}
+        for path in (
+            _DEPARTURE_PROFILES_TIMERS_PATH,
+            _AUXILIARY_HEATING_TIMERS_PATH,
+            _DEPARTURE_TIMERS_PATH,
+        ):
+            for timer in find_path(self.attrs, path, default=()):
+                timers.setdefault(timer.get("id", 0), timer)
+        return timers
+
     def departure_timer(self, timer_id: str | int):
         """Return departure timer."""
-        if is_valid_path(
-            self.attrs,
-            f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.timers",
-        ):
-            timers = find_path(
-                self.attrs,
-                f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.timers",
-            )
-            for timer in timers:
-                if timer.get("id", 0) == timer_id:
-                    return timer
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.timers",
-        ):
-            timers = find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION_TIMERS}.auxiliaryHeatingTimersStatus.value.timers",
-            )
-            for timer in timers:
-                if timer.get("id", 0) == timer_id:
-                    return timer
-        if is_valid_path(
-            self.attrs,
-            f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.timers",
-        ):
-            timers = find_path(
-                self.attrs,
-                f"{Services.DEPARTURE_TIMERS}.departureTimersStatus.value.timers",
-            )
-            for timer in timers:
-                if timer.get("id", 0) == timer_id:
-                    return timer
-        return None
+        return self._departure_timers_by_id.get(timer_id)
 
     def departure_profile(self, profile_id: str | int):
         """Return departure profile."""
-        if is_valid_path(
-            self.attrs,
-            f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.profiles",
-        ):
-            profiles = find_path(
-                self.attrs,
-                f"{Services.DEPARTURE_PROFILES}.departureProfilesStatus.value.profiles",
-            )
-            for profile in profiles:
-                if profile.get("id", 0) == profile_id:
-                    return profile
+        for profile in find_path(self.attrs, _DEPARTURE_PROFILES_PATH, default=()):
+            if profile.get("id", 0) == profile_id:
+                return profile
         return None
 
     # AC Departure timers
@@ -3370,12 +2812,12 @@ class Vehicle:
         """Return last updated timestamp."""
         return self.ac_departure_timer1_last_updated
 
-    @property
+    @_cached_by_state
     def is_ac_departure_timer1_supported(self) -> bool:
         """Check if ac timer 1 is supported."""
         return self.is_ac_departure_timer_supported(1)
 
-    @property
+    @_cached_by_state
     def is_ac_departure_timer2_supported(self) -> bool:
         """Check if ac timer 2 is supported."""
         return self.is_ac_departure_timer_supported(2)
@@ -3388,455 +2830,295 @@ class Vehicle:
         """Return true if ac departure timer is supported."""
         return self.ac_departure_timer(timer_id) is not None
 
-    def ac_departure_timer(self, timer_id: str | int):
-        """Return ac departure timer."""
-        if is_valid_path(
-            self.attrs,
-            f"{Services.CLIMATISATION_TIMERS}.climatisationTimersStatus.value.timers",
-        ):
-            timers = find_path(
-                self.attrs,
-                f"{Services.CLIMATISATION_TIMERS}.climatisationTimersStatus.value.timers",
-            )
-            for timer in timers:
-                if timer.get("id", 0) == timer_id:
-                    return timer
-        return None
-
-    def ac_timer_attributes(self, timer_id: str | int):
-        """Return ac departure timer attributes."""
-        timer = self.ac_departure_timer(timer_id)
-        timer_type = None
-        recurring_on = []
-        start_time = None
-        if timer.get("singleTimer", None):
-            timer_type = "single"
-            start_date_time = timer.get("singleTimer", None).get("startDateTime", None)
-            start_time = (
-                start_date_time.replace(tzinfo=UTC)
-                .astimezone(tz=None)
-                .strftime("%Y-%m-%dT%H:%M:%S")
-            )
-        elif timer.get("recurringTimer", None):
-            timer_type = "recurring"
-            start_date_time = timer.get("recurringTimer", None).get("startTime", None)
-            start_time = (
-                datetime.strptime(start_date_time, "%H:%M")
-                .replace(tzinfo=UTC)
-                .astimezone(tz=None)
-                .strftime("%H:%M")
-            )
-            recurring_days = timer.get("recurringTimer", None).get("recurringOn", None)
-            recurring_on = [day for day in recurring_days if recurring_days.get(day)]
-        return {
-            "timer_id": timer.get("id", None),
-            "timer_type": timer_type,
-            "start_time": start_time,
-            "recurring_on": recurring_on,
-        }
-
-    # Trip data
-    @property
-    def trip_last_entry(self):
-        """Return last trip data entry.
-
-        :return:
-        """
-        return self.attrs.get(Services.TRIP_LAST, {})
-
-    @property
-    def trip_last_average_speed(self):
-        """Return last trip average speed.
-
-        :return:
-        """
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.averageSpeed_kmph")
-
-    @property
-    def trip_last_average_speed_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
-
-    @property
-    def is_trip_last_average_speed_supported(self) -> bool:
-        """Return true if supported.
-
-        :return:
-        """
-        return is_valid_path(
-            self.attrs, f"{Services.TRIP_LAST}.averageSpeed_kmph"
-        ) and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageSpeed_kmph")
-        ) in (float, int)
-
-    @property
-    def trip_last_average_electric_engine_consumption(self):
-        """Return last trip average electric consumption.
-
-        :return:
-        """
-        return float(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageElectricConsumption")
-        )
-
-    @property
-    def trip_last_average_electric_engine_consumption_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
-
-    @property
-    def is_trip_last_average_electric_engine_consumption_supported(self) -> bool:
-        """Return true if supported.
-
-        :return:
-        """
-        return is_valid_path(
-            self.attrs, f"{Services.TRIP_LAST}.averageElectricConsumption"
-        ) and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageElectricConsumption")
-        ) in (float, int)
-
-    @property
-    def trip_last_average_fuel_consumption(self):
-        """Return last trip average fuel consumption.
-
-        :return:
-        """
-        return float(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageFuelConsumption")
-        )
+    def ac_departure_timer(self, timer_id: str | int):
+        """Return ac departure timer."""
+        for timer in find_path(self.attrs, _CLIMATISATION_TIMERS_PATH, default=()):
+            if timer.get("id", 0) == timer_id:
+                return timer
+        return None
 
-    @property
-    def trip_last_average_fuel_consumption_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+    def ac_timer_attributes(self, timer_id: str | int):
+        """Return ac departure timer attributes."""
+        timer = self.ac_departure_timer(timer_id)
+        timer_type = None
+        recurring_on = []
+        start_time = None
+        if timer.get("singleTimer", None):
+            timer_type = "single"
+            start_date_time = timer.get("singleTimer", None).get("startDateTime", None)
+            start_time = start_date_time.astimezone(tz=None).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+        elif timer.get("recurringTimer", None):
+            timer_type = "recurring"
+            start_date_time = timer.get("recurringTimer", None).get("startTime", None)
+            start_time = (
+                datetime.strptime(start_date_time, "%H:%M")
+                .replace(tzinfo=UTC)
+                .astimezone(tz=None)
+                .strftime("%H:%M")
+            )
+            recurring_days = timer.get("recurringTimer", None).get("recurringOn", None)
+            recurring_on = [day for day in recurring_days if recurring_days.get(day)]
+        return {
+            "timer_id": timer.get("id", None),
+            "timer_type": timer_type,
+            "start_time": start_time,
+            "recurring_on": recurring_on,
+        }
 
+    # Trip data
     @property
-    def is_trip_last_average_fuel_consumption_supported(self) -> bool:
-        """Return true if supported.
+    def trip_last_entry(self):
+        """Return last trip data entry.
 
         :return:
         """
-        return is_valid_path(
-            self.attrs, f"{Services.TRIP_LAST}.averageFuelConsumption"
-        ) and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageFuelConsumption")
-        ) in (float, int)
+        return self.attrs.get(Services.TRIP_LAST, {})
 
-    @property
-    def trip_last_average_gas_consumption(self):
-        """Return last trip average gas consumption.
+    def _trip_last(self, key: str):
+        """Return value from last trip data entry."""
+        return self.trip_last_entry.get(key)
 
-        :return:
-        """
-        return float(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageGasConsumption")
-        )
+    def _is_trip_last_supported(self, key: str) -> bool:
+        """Return true if last trip data entry has a numeric value for key."""
+        value = self._trip_last(key)
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
 
-    @property
-    def trip_last_average_gas_consumption_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+    trip_last_average_speed = _named_property(
+        _trip_last, "averageSpeed_kmph", "Return last trip average speed."
+    )
 
-    @property
-    def is_trip_last_average_gas_consumption_supported(self) -> bool:
-        """Return true if supported.
+    @_cached_by_state
+    def trip_last_average_speed_last_updated(self) -> datetime:
+        """Return last updated timestamp."""
+        return self._trip_last("tripEndTimestamp")
 
-        :return:
-        """
-        return is_valid_path(
-            self.attrs, f"{Services.TRIP_LAST}.averageGasConsumption"
-        ) and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageGasConsumption")
-        ) in (float, int)
+    is_trip_last_average_speed_supported = _supported_property(
+        _is_trip_last_supported, "averageSpeed_kmph"
+    )
 
-    @property
-    def trip_last_average_auxillary_consumption(self):
-        """Return last trip average auxiliary consumption.
+    @_cached_by_state
+    def trip_last_average_electric_engine_consumption(self):
+        """Return last trip average electric consumption.
 
         :return:
         """
-        # no example verified yet
-        return self.trip_last_entry.get("averageAuxiliaryConsumption")
-
-    @property
-    def trip_last_average_auxillary_consumption_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+        return float(self._trip_last("averageElectricConsumption"))
 
-    @property
-    def is_trip_last_average_auxillary_consumption_supported(self) -> bool:
-        """Return true if supported.
+    trip_last_average_electric_engine_consumption_last_updated = (
+        trip_last_average_speed_last_updated
+    )
 
-        :return:
-        """
-        return is_valid_path(
-            self.attrs, f"{Services.TRIP_LAST}.averageAuxiliaryConsumption"
-        ) and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageAuxiliaryConsumption")
-        ) in (float, int)
+    is_trip_last_average_electric_engine_consumption_supported = _supported_property(
+        _is_trip_last_supported, "averageElectricConsumption"
+    )
 
-    @property
-    def trip_last_average_aux_consumer_consumption(self):
-        """Return last trip average auxiliary consumer consumption.
+    @_cached_by_state
+    def trip_last_average_fuel_consumption(self):
+        """Return last trip average fuel consumption.
 
         :return:
         """
-        # no example verified yet
-        return self.trip_last_entry.get("averageAuxConsumerConsumption")
+        return float(self._trip_last("averageFuelConsumption"))
 
-    @property
-    def trip_last_average_aux_consumer_consumption_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
-
-    @property
-    def is_trip_last_average_aux_consumer_consumption_supported(self) -> bool:
-        """Return true if supported.
+    trip_last_average_fuel_consumption_last_updated = (
+        trip_last_average_speed_last_updated
+    )
 
-        :return:
-        """
-        return is_valid_path(
-            self.attrs, f"{Services.TRIP_LAST}.averageAuxConsumerConsumption"
-        ) and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.averageAuxConsumerConsumption")
-        ) in (float, int)
+    is_trip_last_average_fuel_consumption_supported = _supported_property(
+        _is_trip_last_supported, "averageFuelConsumption"
+    )
 
-    @property
-    def trip_last_duration(self):
-        """Return last trip duration in minutes(?).
+    @_cached_by_state
+    def trip_last_average_gas_consumption(self):
+        """Return last trip average gas consumption.
 
         :return:
         """
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.travelTime")
+        return float(self._trip_last("averageGasConsumption"))
 
-    @property
-    def trip_last_duration_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+    trip_last_average_gas_consumption_last_updated = (
+        trip_last_average_speed_last_updated
+    )
 
-    @property
-    def is_trip_last_duration_supported(self) -> bool:
-        """Return true if supported.
+    is_trip_last_average_gas_consumption_supported = _supported_property(
+        _is_trip_last_supported, "averageGasConsumption"
+    )
 
-        :return:
-        """
-        return is_valid_path(self.attrs, f"{Services.TRIP_LAST}.travelTime") and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.travelTime")
-        ) in (float, int)
+    # no example verified yet
+    trip_last_average_auxillary_consumption = _named_property(
+        _trip_last,
+        "averageAuxiliaryConsumption",
+        "Return last trip average auxiliary consumption.",
+    )
 
-    @property
-    def trip_last_length(self):
-        """Return last trip length.
+    trip_last_average_auxillary_consumption_last_updated = (
+        trip_last_average_speed_last_updated
+    )
 
-        :return:
-        """
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.mileage_km")
+    is_trip_last_average_auxillary_consumption_supported = _supported_property(
+        _is_trip_last_supported, "averageAuxiliaryConsumption"
+    )
 
-    @property
-    def trip_last_length_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+    # no example verified yet
+    trip_last_average_aux_consumer_consumption = _named_property(
+        _trip_last,
+        "averageAuxConsumerConsumption",
+        "Return last trip average auxiliary consumer consumption.",
+    )
 
-    @property
-    def is_trip_last_length_supported(self) -> bool:
-        """Return true if supported.
+    trip_last_average_aux_consumer_consumption_last_updated = (
+        trip_last_average_speed_last_updated
+    )
 
-        :return:
-        """
-        return is_valid_path(self.attrs, f"{Services.TRIP_LAST}.mileage_km") and type(
-            find_path(self.attrs, f"{Services.TRIP_LAST}.mileage_km")
-        ) in (float, int)
+    is_trip_last_average_aux_consumer_consumption_supported = _supported_property(
+        _is_trip_last_supported, "averageAuxConsumerConsumption"
+    )
 
-    @property
-    def trip_last_recuperation(self):
-        """Return last trip recuperation.
+    trip_last_duration = _named_property(
+        _trip_last, "travelTime", "Return last trip duration in minutes(?)."
+    )
 
-        :return:
-        """
-        # Not implemented
-        return self.trip_last_entry.get("recuperation")
+    trip_last_duration_last_updated = trip_last_average_speed_last_updated
 
-    @property
-    def trip_last_recuperation_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+    is_trip_last_duration_supported = _supported_property(
+        _is_trip_last_supported, "travelTime"
+    )
 
-    @property
-    def is_trip_last_recuperation_supported(self) -> bool:
-        """Return true if supported.
+    trip_last_length = _named_property(
+        _trip_last, "mileage_km", "Return last trip length."
+    )
 
-        :return:
-        """
-        # Not implemented
-        response = self.trip_last_entry
-        return response and type(response.get("recuperation", None)) in (float, int)
+    trip_last_length_last_updated = trip_last_average_speed_last_updated
 
-    @property
-    def trip_last_average_recuperation(self):
-        """Return last trip total recuperation.
+    is_trip_last_length_supported = _supported_property(
+        _is_trip_last_supported, "mileage_km"
+    )
 
-        :return:
-        """
-        return self.trip_last_entry.get("averageRecuperation")
+    # Not implemented
+    trip_last_recuperation = _named_property(
+        _trip_last, "recuperation", "Return last trip recuperation."
+    )
 
-    @property
-    def trip_last_average_recuperation_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+    trip_last_recuperation_last_updated = trip_last_average_speed_last_updated
 
-    @property
-    def is_trip_last_average_recuperation_supported(self) -> bool:
-        """Return true if supported.
+    # Not implemented
+    is_trip_last_recuperation_supported = _supported_property(
+        _is_trip_last_supported, "recuperation"
+    )
 
-        :return:
-        """
-        response = self.trip_last_entry
-        return response and type(response.get("averageRecuperation", None)) in (
-            float,
-            int,
-        )
+    trip_last_average_recuperation = _named_property(
+        _trip_last, "averageRecuperation", "Return last trip total recuperation."
+    )
 
-    @property
-    def trip_last_total_electric_consumption(self):
-        """Return last trip total electric consumption.
+    trip_last_average_recuperation_last_updated = trip_last_average_speed_last_updated
 
-        :return:
-        """
-        # Not implemented
-        return self.trip_last_entry.get("totalElectricConsumption")
+    is_trip_last_average_recuperation_supported = _supported_property(
+        _is_trip_last_supported, "averageRecuperation"
+    )
 
-    @property
-    def trip_last_total_electric_consumption_last_updated(self) -> datetime:
-        """Return last updated timestamp."""
-        return find_path(self.attrs, f"{Services.TRIP_LAST}.tripEndTimestamp")
+    # Not implemented
+    trip_last_total_electric_consumption = _named_property(
+        _trip_last,
+        "totalElectricConsumption",
+        "Return last trip total electric consumption.",
+    )
 
-    @property
-    def is_trip_last_total_electric_consumption_supported(self) -> bool:
-        """Return true if supported.
+    trip_last_total_electric_consumption_last_updated = (
+        trip_last_average_speed_last_updated
+    )
 
-        :return:
-        """
-        # Not implemented
-        response = self.trip_last_entry
-        return response and type(response.get("totalElectricConsumption", None)) in (
-            float,
-            int,
-        )
+    # Not implemented
+    is_trip_last_total_electric_consumption_supported = _supported_property(
+        _is_trip_last_supported, "totalElectricConsumption"
+    )
 
     # Status of set data requests
     @property
     def refresh_action_status(self):
         """Return latest status of data refresh request."""
-        return self._requests.get("refresh", {}).get("status", "None")
+        return self._request_status("refresh")
 
     @property
     def charger_action_status(self):
         """Return latest status of charger request."""
-        return self._requests.get("batterycharge", {}).get("status", "None")
+        return self._request_status("batterycharge")
 
     @property
     def climater_action_status(self):
         """Return latest status of climater request."""
-        return self._requests.get("climatisation", {}).get("status", "None")
+        return self._request_status("climatisation")
 
     @property
     def lock_action_status(self):
         """Return latest status of lock action request."""
-        return self._requests.get("lock", {}).get("status", "None")
+        return self._request_status("lock")
 
     # Requests data
     @property
     def refresh_data(self):
         """Get state of data refresh."""
-        return self._requests.get("refresh", {}).get("id", False)
+        request = self._requests.get("refresh")
+        return request.id if request and request.id is not None else False
 
     @property
     def refresh_data_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return self._requests.get("refresh", {}).get("timestamp")
+        request = self._requests.get("refresh")
+        return request.timestamp if request else None
 
-    @property
-    def is_refresh_data_supported(self) -> bool:
-        """Return true, as data refresh is always supported."""
-        return True
+    # Data refresh is always supported
+    is_refresh_data_supported = True
 
     @property
     def request_in_progress(self) -> bool:
         """Check of any requests are currently in progress."""
-        try:
-            return any(
-                isinstance(value, dict) and "id" in value and bool(value["id"])
-                for value in self._requests.values()
-            )
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            _LOGGER.warning(e)
-        return False
+        return any(request.id for request in self._requests.values())
 
     @property
     def request_in_progress_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        try:
-            # Get all timestamps in the dictionary
-            timestamps = [
-                item["timestamp"]
-                for item in self._requests.values()
-                if isinstance(item, dict) and "timestamp" in item
-            ]
-
-            # Return the most recent timestamp
-            return max(timestamps) if timestamps else datetime.now(UTC)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            _LOGGER.warning(e)
-        return datetime.now(UTC)
+        # Return the most recent timestamp
+        return max(
+            (
+                request.timestamp
+                for request in self._requests.values()
+                if request.timestamp is not None
+            ),
+            default=datetime.now(UTC),
+        )
 
-    @property
-    def is_request_in_progress_supported(self):
-        """Request in progress is always supported."""
-        return True
+    # Request in progress is always supported
+    is_request_in_progress_supported = True
 
     @property
     def request_results(self) -> dict:
         """Get last request result."""
         data = {
-            "latest": self._requests.get("latest", None),
-            "state": self._requests.get("state", None),
+            "latest": self._requests_latest,
+            "state": self._requests_state,
         }
-        for section in self._requests:
-            if section in [
-                "departuretimer",
-                "batterycharge",
-                "climatisation",
-                "refresh",
-                "lock",
-            ]:
-                data[section] = self._requests[section].get("status", "Unknown")
+        for topic, request in self._requests.items():
+            if topic in REQUEST_RESULT_TOPICS:
+                data[topic] = request.status
         return data
 
     @property
     def request_results_last_updated(self) -> datetime | None:
         """Get last updated time."""
-        if self._requests.get("latest", "") != "":
-            return self._requests.get(str(self._requests.get("latest")), {}).get(
-                "timestamp"
-            )
+        if self._requests_latest != "":
+            request = self._requests.get(self._requests_latest)
+            return request.timestamp if request else None
         # all requests should have more or less the same timestamp anyway, so
         # just return the first one
-        for section in [
-            "departuretimer",
-            "batterycharge",
-            "climatisation",
-            "refresh",
-            "lock",
-        ]:
-            if section in self._requests:
-                return self._requests[section].get("timestamp")
+        for topic, request in self._requests.items():
+            if topic in REQUEST_RESULT_TOPICS:
+                return request.timestamp
         return None
 
-    @property
-    def is_request_results_supported(self):
-        """Request results is supported if in progress is supported."""
-        return self.is_request_in_progress_supported
+    # Request results are supported if in progress is supported
+    is_request_results_supported = is_request_in_progress_supported
 
     @property
     def requests_results_last_updated(self):
@@ -3863,313 +3145,183 @@ class Vehicle:
             """
             return obj.isoformat() if isinstance(obj, datetime) else obj
 
-        return to_json(
-            OrderedDict(sorted(self.attrs.items())), indent=4, default=serialize
-        )
+        return to_json(dict(sorted(self.attrs.items())), indent=4, default=serialize)
 
     def is_primary_drive_electric(self):
         """Check if primary engine is electric."""
-        return (
-            find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.primaryEngineType",
-            )
-            == ENGINE_TYPE_ELECTRIC
-        )
+        return find_path(self.attrs, _PRIMARY_ENGINE_TYPE_PATH) == ENGINE_TYPE_ELECTRIC
 
     def is_secondary_drive_electric(self):
         """Check if secondary engine is electric."""
         return (
-            is_valid_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.secondaryEngineType",
-            )
-            and find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.secondaryEngineType",
-            )
+            find_path(self.attrs, _SECONDARY_ENGINE_TYPE_PATH, default=None)
             == ENGINE_TYPE_ELECTRIC
         )
 
-    def is_primary_drive_combustion(self):
-        """Check if primary engine is combustion."""
-        engine_type = ""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.type"
-        ):
-            engine_type = find_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.primaryEngine.type",
-            )
-
-        if is_valid_path(
+    @_cached_by_state
+    def _engine_types(self) -> tuple[str, str]:
+        """Return primary and secondary engine type, or "" if unknown."""
+        # The measurements values take precedence over the fuel status ones
+        primary = find_first_path(
             self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.primaryEngineType",
-        ):
-            engine_type = find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.primaryEngineType",
-            )
+            _PRIMARY_ENGINE_TYPE_PATH,
+            _FUEL_STATUS_PRIMARY_ENGINE_TYPE_PATH,
+            default="",
+        )
+        secondary = find_first_path(
+            self.attrs,
+            _SECONDARY_ENGINE_TYPE_PATH,
+            _FUEL_STATUS_SECONDARY_ENGINE_TYPE_PATH,
+            default="",
+        )
+        return primary, secondary
 
-        return engine_type in ENGINE_TYPE_COMBUSTION
+    def is_primary_drive_combustion(self):
+        """Check if primary engine is combustion."""
+        return self._engine_types[0] in ENGINE_TYPE_COMBUSTION
 
     def is_secondary_drive_combustion(self):
         """Check if secondary engine is combustion."""
-        engine_type = ""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.secondaryEngine.type"
-        ):
-            engine_type = find_path(
-                self.attrs,
-                f"{Services.FUEL_STATUS}.rangeStatus.value.secondaryEngine.type",
-            )
-
-        if is_valid_path(
-            self.attrs,
-            f"{Services.MEASUREMENTS}.fuelLevelStatus.value.secondaryEngineType",
-        ):
-            engine_type = find_path(
-                self.attrs,
-                f"{Services.MEASUREMENTS}.fuelLevelStatus.value.secondaryEngineType",
-            )
+        return self._engine_types[1] in ENGINE_TYPE_COMBUSTION
 
-        return engine_type in ENGINE_TYPE_COMBUSTION
+    @_cached_by_state
+    def _car_type(self) -> str | None:
+        """Return reported car type, or None if unknown."""
+        return find_first_path(
+            self.attrs, _FUEL_STATUS_CAR_TYPE_PATH, _FUEL_LEVEL_CAR_TYPE_PATH
+        )
 
     def is_primary_drive_gas(self):
         """Check if primary engine is gas."""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-                )
-                == ENGINE_TYPE_GAS
-            )
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-                )
-                == ENGINE_TYPE_GAS
-            )
-        return False
+        return self._car_type in ENGINE_TYPE_GAS
 
-    @property
+    @_cached_by_state
     def is_car_type_electric(self):
         """Check if car type is electric."""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-                )
-                == ENGINE_TYPE_ELECTRIC
-            )
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-                )
-                == ENGINE_TYPE_ELECTRIC
-            )
-        return False
+        return self._car_type == ENGINE_TYPE_ELECTRIC
 
-    @property
+    @_cached_by_state
     def is_car_type_diesel(self):
         """Check if car type is diesel."""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-                )
-                == ENGINE_TYPE_DIESEL
-            )
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-                )
-                == ENGINE_TYPE_DIESEL
-            )
-        return False
+        return self._car_type == ENGINE_TYPE_DIESEL
 
-    @property
+    @_cached_by_state
     def is_car_type_gasoline(self):
         """Check if car type is gasoline."""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-                )
-                == ENGINE_TYPE_GASOLINE
-            )
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-                )
-                == ENGINE_TYPE_GASOLINE
-            )
-        return False
+        return self._car_type == ENGINE_TYPE_GASOLINE
 
-    @property
+    @_cached_by_state
     def is_car_type_hybrid(self):
         """Check if car type is hybrid."""
-        if is_valid_path(
-            self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.FUEL_STATUS}.rangeStatus.value.carType"
-                )
-                == ENGINE_TYPE_HYBRID
-            )
-        if is_valid_path(
-            self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-        ):
-            return (
-                find_path(
-                    self.attrs, f"{Services.MEASUREMENTS}.fuelLevelStatus.value.carType"
-                )
-                == ENGINE_TYPE_HYBRID
-            )
-        return False
+        return self._car_type == ENGINE_TYPE_HYBRID
 
-    @property
+    @_cached_by_state
     def has_combustion_engine(self):
         """Return true if car has a combustion engine."""
         return (
             self.is_primary_drive_combustion() or self.is_secondary_drive_combustion()
         )
 
+    @_cached_by_state
+    def _service_status(self) -> dict:
+        """Return reported API statuses."""
+        return self.attrs.get(Services.SERVICE_STATUS) or {}
+
+    def _api_status(self, api: str) -> str:
+        """Return reported status of an API, or "Unknown" if not reported."""
+        return self._service_status.get(api, "Unknown")
+
     @property
     def api_vehicles_status(self) -> bool:
         """Check vehicles API status."""
-        return self.attrs.get(Services.SERVICE_STATUS, {}).get("vehicles", "Unknown")
+        return self._api_status("vehicles")
 
     @property
     def api_vehicles_status_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
-    @property
-    def is_api_vehicles_status_supported(self):
-        """Vehicles API status is always supported."""
-        return True
+    # Vehicles API status is always supported
+    is_api_vehicles_status_supported = True
 
     @property
     def api_capabilities_status(self) -> bool:
         """Check capabilities API status."""
-        return self.attrs.get(Services.SERVICE_STATUS, {}).get(
-            "capabilities", "Unknown"
-        )
+        return self._api_status("capabilities")
 
     @property
     def api_capabilities_status_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
-    @property
-    def is_api_capabilities_status_supported(self):
-        """Capabilities API status is always supported."""
-        return True
+    # Capabilities API status is always supported
+    is_api_capabilities_status_supported = True
 
     @property
     def api_trips_status(self) -> bool:
         """Check trips API status."""
-        return self.attrs.get(Services.SERVICE_STATUS, {}).get("trips", "Unknown")
+        return self._api_status("trips")
 
     @property
     def api_trips_status_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
     @property
     def is_api_trips_status_supported(self):
         """Check if Trips API status is supported."""
-        if self._services.get(Services.TRIP_STATISTICS, {}).get("active", False):
-            return True
-        return False
+        return self._services[Services.TRIP_STATISTICS]["active"]
 
     @property
     def api_selectivestatus_status(self) -> bool:
         """Check selectivestatus API status."""
-        return self.attrs.get(Services.SERVICE_STATUS, {}).get(
-            "selectivestatus", "Unknown"
-        )
+        return self._api_status("selectivestatus")
 
     @property
     def api_selectivestatus_status_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
-    @property
-    def is_api_selectivestatus_status_supported(self):
-        """Selectivestatus API status is always supported."""
-        return True
+    # Selectivestatus API status is always supported
+    is_api_selectivestatus_status_supported = True
 
     @property
     def api_parkingposition_status(self) -> bool:
         """Check parkingposition API status."""
-        return self.attrs.get(Services.SERVICE_STATUS, {}).get(
-            "parkingposition", "Unknown"
-        )
+        return self._api_status("parkingposition")
 
     @property
     def api_parkingposition_status_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
     @property
     def is_api_parkingposition_status_supported(self):
         """Check if Parkingposition API status is supported."""
-        if self._services.get(Services.PARKING_POSITION, {}).get("active", False):
-            return True
-        return False
+        return self._services[Services.PARKING_POSITION]["active"]
 
     @property
     def api_token_status(self) -> bool:
         """Check token API status."""
-        return self.attrs.get(Services.SERVICE_STATUS, {}).get("token", "Unknown")
+        return self._api_status("token")
 
     @property
     def api_token_status_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
-    @property
-    def is_api_token_status_supported(self):
-        """Parkingposition API status is always supported."""
-        return True
+    # Token API status is always supported
+    is_api_token_status_supported = True
 
     @property
     def last_data_refresh(self) -> datetime:
         """Check when services were refreshed successfully for the last time."""
-        last_data_refresh_path = "refreshTimestamp"
-        if is_valid_path(self.attrs, last_data_refresh_path):
-            return find_path(self.attrs, last_data_refresh_path)
-        return None
+        return find_path(self.attrs, "refreshTimestamp", default=None)
 
     @property
     def last_data_refresh_last_updated(self) -> datetime:
         """Return attribute last updated timestamp."""
-        return datetime.now(UTC)
+        return self._last_update_time
 
-    @property
-    def is_last_data_refresh_supported(self):
-        """Last data refresh is always supported."""
-        return True
+    # Last data refresh is always supported
+    is_last_data_refresh_supported = True